@@ -83,7 +83,14 @@ class FlowListSerializer(ModelSerializer):
             "current_state_name",
             "display_name",
         ]
-        read_only_fields = ["id", "app_name", "flow_type", "graph_version", "created_at"]
+        read_only_fields = [
+            "id",
+            "app_name",
+            "flow_type",
+            "graph_version",
+            "created_at",
+            "last_resumed_at",
+        ]
 
     def get_current_state_name(self, obj):
         """Get current state name only for interrupted flows (performance optimization)."""
@@ -115,13 +122,23 @@ class FlowDetailSerializer(ModelSerializer):
             "current_state_name",
             "display_name",
         ]
-        read_only_fields = ["id", "app_name", "flow_type", "graph_version", "created_at"]
+        read_only_fields = [
+            "id",
+            "app_name",
+            "flow_type",
+            "graph_version",
+            "created_at",
+            "last_resumed_at",
+        ]
 
     def get_state(self, obj):
         """
         Get state and convert any Pydantic models to dicts for JSON serialization.
+
+        A precomputed state can be passed as ``context["state"]`` to skip reading the
+        checkpoint again (e.g. right after the flow has been run).
         """
-        state = obj.state
+        state = self.context["state"] if "state" in self.context else obj.state
         if state:
             # Convert any remaining Pydantic models to dicts
             return self._convert_pydantic_to_dict(state)
@@ -1,6 +1,8 @@
 import logging
 
 from django.conf import settings
+from django.db.models import Count
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter, OpenApiResponse, extend_schema
 from django.utils.module_loading import import_string
@@ -18,7 +20,7 @@ from graflow.api.serializers import (
     FlowStatsSerializer,
     FlowTypeSerializer,
 )
-from graflow.models.flows import Flow, filter_flows_by_permissions
+from graflow.models.flows import Flow, filter_flows_by_permissions, prefetch_flow_states
 from graflow.models.registry import FlowType
 
 logger = logging.getLogger(__name__)
@@ -50,7 +52,7 @@ class FlowViewSet(viewsets.GenericViewSet):
         from rest_framework.permissions import IsAdminUser
 
         action = self.action
-        app_name = getattr(settings, "GRAFLOW_APP_NAME", "graflow")
+        app_name = self._get_app_name()
 
         # Stats endpoint is admin-only
         if action == "stats":
@@ -63,7 +65,7 @@ class FlowViewSet(viewsets.GenericViewSet):
             if pk:
                 try:
                     flow = Flow.objects.get(pk=pk)
-                    flow_type_obj = FlowType.objects.get_latest(flow.app_name, flow.flow_type)
+                    flow_type_obj = self._get_latest_flow_type(flow.app_name, flow.flow_type)
                     if flow_type_obj:
                         return [flow_type_obj.get_permission_instance("resume")]
                 except Flow.DoesNotExist:
@@ -76,7 +78,7 @@ class FlowViewSet(viewsets.GenericViewSet):
                 self.request.data.get("flow_type") if hasattr(self.request, "data") else None
             )
             if flow_type:
-                flow_type_obj = FlowType.objects.get_latest(app_name, flow_type)
+                flow_type_obj = self._get_latest_flow_type(app_name, flow_type)
                 if flow_type_obj:
                     return [flow_type_obj.get_permission_instance("crud")]
             return get_permissions()  # Fallback
@@ -88,7 +90,7 @@ class FlowViewSet(viewsets.GenericViewSet):
             if pk:
                 try:
                     flow = Flow.objects.get(pk=pk)
-                    flow_type_obj = FlowType.objects.get_latest(flow.app_name, flow.flow_type)
+                    flow_type_obj = self._get_latest_flow_type(flow.app_name, flow.flow_type)
                     if flow_type_obj:
                         return [flow_type_obj.get_permission_instance("crud")]
                 except Flow.DoesNotExist:
@@ -103,7 +105,7 @@ class FlowViewSet(viewsets.GenericViewSet):
                 else None
             )
             if flow_type:
-                flow_type_obj = FlowType.objects.get_latest(app_name, flow_type)
+                flow_type_obj = self._get_latest_flow_type(app_name, flow_type)
                 if flow_type_obj:
                     return [flow_type_obj.get_permission_instance("crud")]
             # If no flow_type param, use default (we'll filter queryset in the action method)
@@ -125,7 +127,7 @@ class FlowViewSet(viewsets.GenericViewSet):
         from graflow.api.throttling import FlowCreationThrottle, FlowResumeThrottle
 
         action = self.action
-        app_name = getattr(settings, "GRAFLOW_APP_NAME", "graflow")
+        app_name = self._get_app_name()
 
         # Resume uses resume throttle
         if action == "resume":
@@ -133,7 +135,7 @@ class FlowViewSet(viewsets.GenericViewSet):
             if pk:
                 try:
                     flow = Flow.objects.get(pk=pk)
-                    flow_type_obj = FlowType.objects.get_latest(flow.app_name, flow.flow_type)
+                    flow_type_obj = self._get_latest_flow_type(flow.app_name, flow.flow_type)
                     if flow_type_obj:
                         throttle = flow_type_obj.get_throttle_instance("resume")
                         if throttle:
@@ -149,7 +151,7 @@ class FlowViewSet(viewsets.GenericViewSet):
                 self.request.data.get("flow_type") if hasattr(self.request, "data") else None
             )
             if flow_type:
-                flow_type_obj = FlowType.objects.get_latest(app_name, flow_type)
+                flow_type_obj = self._get_latest_flow_type(app_name, flow_type)
                 if flow_type_obj:
                     throttle = flow_type_obj.get_throttle_instance("crud")
                     if throttle:
@@ -163,7 +165,7 @@ class FlowViewSet(viewsets.GenericViewSet):
             if pk:
                 try:
                     flow = Flow.objects.get(pk=pk)
-                    flow_type_obj = FlowType.objects.get_latest(flow.app_name, flow.flow_type)
+                    flow_type_obj = self._get_latest_flow_type(flow.app_name, flow.flow_type)
                     if flow_type_obj:
                         throttle = flow_type_obj.get_throttle_instance("crud")
                         if throttle:
@@ -181,7 +183,7 @@ class FlowViewSet(viewsets.GenericViewSet):
                 else None
             )
             if flow_type:
-                flow_type_obj = FlowType.objects.get_latest(app_name, flow_type)
+                flow_type_obj = self._get_latest_flow_type(app_name, flow_type)
                 if flow_type_obj:
                     throttle = flow_type_obj.get_throttle_instance("crud")
                     if throttle:
@@ -192,6 +194,31 @@ class FlowViewSet(viewsets.GenericViewSet):
         # Default: fall back to DRF defaults
         return self._get_default_throttles()
 
+    def _get_app_name(self) -> str:
+        """
+        Get the GRAFLOW_APP_NAME setting, read once per view instance.
+
+        Permission checks, throttling and the action all need it; settings are still re-read on
+        the next request so runtime overrides keep working.
+        """
+        if not hasattr(self, "_app_name"):
+            self._app_name: str = getattr(settings, "GRAFLOW_APP_NAME", "graflow")
+        return self._app_name
+
+    def _get_latest_flow_type(self, app_name: str, flow_type: str) -> FlowType | None:
+        """
+        Get the latest FlowType for (app_name, flow_type), memoized on the view instance.
+
+        DRF instantiates the viewset once per request, so permission checks, throttling and
+        the action itself share a single lookup without caching across requests.
+        """
+        if not hasattr(self, "_latest_flow_types"):
+            self._latest_flow_types: dict[tuple[str, str], FlowType | None] = {}
+        key = (app_name, flow_type)
+        if key not in self._latest_flow_types:
+            self._latest_flow_types[key] = FlowType.objects.get_latest(app_name, flow_type)
+        return self._latest_flow_types[key]
+
     @staticmethod
     def _get_default_throttles():
         """Instantiate throttles from current DRF settings."""
@@ -259,6 +286,15 @@ class FlowViewSet(viewsets.GenericViewSet):
         Use dot notation for nested fields: `state__counter=5` or `state__nested_data__field=value`.
         Multiple state filters are combined with AND logic.
         
+        Values are matched against the state as stored in JSON:
+        - Numbers compare by value, so `5`, `5.0` and `"5"` all match `state__counter=5` and
+          `state__counter=5.0`
+        - `True`/`False` match booleans as well as the strings "True"/"False"
+        - Other values must equal the stored string exactly: datetimes are stored in ISO 8601
+          (`2024-05-01T09:30:00Z`) and decimals as written (`1.50` does not match `1.5`)
+        - Lists and objects cannot be matched from a query string, not even by their text
+        - Missing and null fields never match
+        
         **Examples:**
         - List all interrupted flows: `/flows/?status=interrupted`
         - List flows of specific type: `/flows/?flow_type=hello_world`
@@ -309,7 +345,10 @@ class FlowViewSet(viewsets.GenericViewSet):
                 description=(
                     "Filter by state fields. Use dot notation for nested fields "
                     "(e.g., state__counter=5, state__nested_data__field=value). "
-                    "Multiple filters are combined with AND."
+                    "Multiple filters are combined with AND. Numbers match by value "
+                    "(5 matches 5.0), True/False match booleans, and other values must equal "
+                    "the stored JSON string (ISO 8601 datetimes, decimals as written); lists "
+                    "and objects never match."
                 ),
                 style="deepObject",
             ),
@@ -373,23 +412,26 @@ class FlowViewSet(viewsets.GenericViewSet):
 
         # Order by recency
         flows = flows.by_recency()
+        if not is_detailed:
+            flows = flows.lightweight()
 
         # Extract and apply state filters
-        state_filters = {}
-        for key, value in request.query_params.items():
-            if key.startswith("state__"):
-                field_path = key[7:]  # Remove "state__" prefix
-                state_filters[field_path] = value
+        # (key[7:] strips the "state__" prefix)
+        state_filters = {
+            key[7:]: value
+            for key, value in request.query_params.items()
+            if key.startswith("state__")
+        }
 
         if state_filters:
             flows = flows.filter_by_state(**state_filters)
-        else:
-            flows = list(flows)
 
         # Filter by permissions (object-level)
         flows = filter_flows_by_permissions(flows, request, self, permission_type="crud")
 
         if is_detailed:
+            # Read every flow's graph snapshot in one query instead of one per serialized flow
+            flows = prefetch_flow_states(flows)
             serializer = FlowDetailSerializer(flows, many=True)
         else:
             serializer = FlowListSerializer(flows, many=True)
@@ -491,8 +533,8 @@ class FlowViewSet(viewsets.GenericViewSet):
         flow_type = validated_data["flow_type"]
 
         try:
-            app_name = getattr(settings, "GRAFLOW_APP_NAME", "graflow")
-            flow_type_obj = FlowType.objects.get_latest(app_name, flow_type)
+            app_name = self._get_app_name()
+            flow_type_obj = self._get_latest_flow_type(app_name, flow_type)
             if flow_type_obj is None:
                 return Response(
                     {"error": f"No graph found for flow_type '{flow_type}' in app '{app_name}'"},
@@ -515,10 +557,10 @@ class FlowViewSet(viewsets.GenericViewSet):
             state = dict(validated_data.get("state") or {})
             state["user_id"] = user_id
             state["flow_id"] = flow.id
-            self._resume_flow(flow, state)
+            result_state = self._resume_flow(flow, state)
         except Exception as e:
             # Clean up the flow if initialization fails
-            logger.error(f"Error initializing flow {flow.id}: {str(e)}", exc_info=True)
+            logger.error("Error initializing flow %s: %s", flow.id, e, exc_info=True)
             flow.refresh_from_db()
             return Response(
                 {
@@ -531,7 +573,10 @@ class FlowViewSet(viewsets.GenericViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        response_serializer = FlowDetailSerializer(flow)
+        # A completed run already returned the full final state, so reuse it instead of
+        # reading the checkpoint back; interrupted runs only return the interrupt payload.
+        context = {"state": result_state} if flow.status == Flow.STATUS_COMPLETED else {}
+        response_serializer = FlowDetailSerializer(flow, context=context)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
     @extend_schema(
@@ -559,8 +604,9 @@ class FlowViewSet(viewsets.GenericViewSet):
         completed. Unlike the `/cancel/` action, this never raises and is fully
         idempotent.
         """
-        flow = self.get_object()
-        flow.mark_cancelled()
+        # Single UPDATE instead of load + save; the base queryset already excludes cancelled flows
+        if not self.get_queryset().filter(pk=pk).update(status=Flow.STATUS_CANCELLED):
+            raise Http404
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @extend_schema(
@@ -610,23 +656,22 @@ class FlowViewSet(viewsets.GenericViewSet):
 
         Returns 400 if flow is already in a terminal state.
         """
-        flow = self.get_object()
-
-        try:
-            flow.cancel()
+        if self.get_queryset().filter(pk=pk).cancel_if_active():
             return Response(
-                {"message": "Flow cancelled successfully", "flow_id": flow.id},
+                {"message": "Flow cancelled successfully", "flow_id": int(pk)},
                 status=status.HTTP_200_OK,
             )
-        except ValueError as e:
-            return Response(
-                {
-                    "error": str(e),
-                    "flow_id": flow.id,
-                    "flow_status": flow.status,
-                },
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+
+        # Nothing was cancelled: either the flow doesn't exist (404) or it is already terminal
+        flow = self.get_object()
+        return Response(
+            {
+                "error": f"Cannot cancel flow in terminal state: {flow.status}",
+                "flow_id": flow.id,
+                "flow_status": flow.status,
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
     @extend_schema(
         summary="Resume a flow",
@@ -740,7 +785,7 @@ class FlowViewSet(viewsets.GenericViewSet):
             return Response(serializer.data, status=status.HTTP_200_OK)
         except ValueError as e:
             # Flow model validation error (e.g., can't resume)
-            logger.warning(f"Validation error resuming flow {flow.id}: {str(e)}")
+            logger.warning("Validation error resuming flow %s: %s", flow.id, e)
             return Response(
                 {
                     "error": str(e),
@@ -751,7 +796,7 @@ class FlowViewSet(viewsets.GenericViewSet):
             )
         except Exception as e:
             # Graph execution error
-            logger.error(f"Error resuming flow {flow.id}: {str(e)}", exc_info=True)
+            logger.error("Error resuming flow %s: %s", flow.id, e, exc_info=True)
             flow.refresh_from_db()  # Get updated status (may be FAILED)
             return Response(
                 {
@@ -811,22 +856,23 @@ class FlowViewSet(viewsets.GenericViewSet):
         """
         flows = self.get_base_queryset(include_cancelled=True)
 
-        # Get distinct flow types for this user
-        flow_types = flows.values_list("flow_type", flat=True).distinct()
+        # Count all statuses in a single GROUP BY; the total is derived from the same rows
+        status_counts = dict(
+            flows.order_by().values("status").annotate(c=Count("id")).values_list("status", "c")
+        )
 
         stats_data = {
-            "total": flows.count(),
+            "total": sum(status_counts.values()),
             "by_status": {
-                "pending": flows.filter(status=Flow.STATUS_PENDING).count(),
-                "running": flows.filter(status=Flow.STATUS_RUNNING).count(),
-                "interrupted": flows.filter(status=Flow.STATUS_INTERRUPTED).count(),
-                "completed": flows.filter(status=Flow.STATUS_COMPLETED).count(),
-                "failed": flows.filter(status=Flow.STATUS_FAILED).count(),
-                "cancelled": flows.filter(status=Flow.STATUS_CANCELLED).count(),
-            },
-            "by_type": {
-                flow_type: flows.filter(flow_type=flow_type).count() for flow_type in flow_types
+                status_value: status_counts.get(status_value, 0)
+                for status_value, _ in Flow.STATUS_CHOICES
             },
+            "by_type": dict(
+                flows.order_by()
+                .values("flow_type")
+                .annotate(c=Count("id"))
+                .values_list("flow_type", "c")
+            ),
         }
 
         return Response(stats_data, status=status.HTTP_200_OK)
@@ -909,10 +955,6 @@ class FlowViewSet(viewsets.GenericViewSet):
         # Order by most recently interacted/updated
         flows = flows.by_recency()
 
-        # Convert to list if needed for permission filtering
-        if not isinstance(flows, list):
-            flows = list(flows)
-
         # Filter by permissions (object-level)
         flows = filter_flows_by_permissions(flows, request, self, permission_type="crud")
 
@@ -964,6 +1006,12 @@ class FlowTypeViewSet(viewsets.ViewSet):
 
         Returns metadata about all flow types that can be used to create flows.
         """
-        flow_types = FlowType.objects.active()
+        # Ordered by the (app_name, flow_type, version) unique index, so the database returns the
+        # listing sorted without a separate sort step, and only the serialized columns are loaded
+        flow_types = (
+            FlowType.objects.active()
+            .order_by("app_name", "flow_type", "version")
+            .only(*FlowTypeSerializer.Meta.fields)
+        )
         serializer = FlowTypeSerializer(flow_types, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -1,18 +1,104 @@
 import inspect
-from collections.abc import Callable
+import operator
+import sys
+import weakref
+from collections.abc import Callable, Sequence
 from typing import Any, NamedTuple, TypeVar
 
 from django.conf import settings
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph
 from langgraph.types import CachePolicy, interrupt
 
 from graflow.graphs.base import BaseGraphState
 from graflow.logger.logging import add_logging_to_node
-from graflow.storage.cache import create_cache_key_from_fields
+from graflow.storage.cache import create_cache_key_from_fields, create_cache_key_from_values
 
 StateT = TypeVar("StateT", bound=BaseGraphState)
 
 
+# Weakly keyed so per-build closures and partials are not kept alive by the cache
+_param_names_cache: "weakref.WeakKeyDictionary[Callable[..., Any], tuple[str, ...]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _read_param_names(func: Callable[..., Any]) -> tuple[str, ...]:
+    """
+    Read the parameter names of a function.
+
+    Plain functions are read straight from their code object; anything else (wrapped
+    functions, partials, callable objects, *args/**kwargs or keyword-only parameters) falls
+    back to inspect.signature.
+    """
+    code = getattr(func, "__code__", None)
+    if (
+        inspect.isfunction(func)
+        and not hasattr(func, "__wrapped__")
+        and code is not None
+        and code.co_kwonlyargcount == 0
+        and not code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+    ):
+        return code.co_varnames[: code.co_argcount]
+    return tuple(inspect.signature(func).parameters)
+
+
+def _get_param_names(func: Callable[..., Any]) -> tuple[str, ...]:
+    """
+    Get the parameter names of a function, cached per function object while it is alive.
+
+    Callables that cannot be weakly referenced or hashed are read without caching.
+    """
+    try:
+        return _param_names_cache[func]
+    except KeyError:
+        pass
+    except TypeError:
+        return _read_param_names(func)
+
+    param_names = _read_param_names(func)
+    _param_names_cache[func] = param_names
+    return param_names
+
+
+def _no_values(state: Any) -> tuple[Any, ...]:
+    """Shared extractor for nodes that read no fields."""
+    return ()
+
+
+def _no_fields(state: Any) -> dict[str, Any]:
+    """Shared extractor for nodes that send no fields."""
+    return {}
+
+
+def _values_getter(fields: Sequence[str]) -> Callable[[Any], tuple[Any, ...]]:
+    """
+    Build a function that extracts the given fields from a state as a tuple of values.
+
+    The attribute lookups are resolved once here with operator.attrgetter, so nodes don't
+    loop over the field names on every invocation.
+    """
+    names = tuple(fields)
+    if not names:
+        return _no_values
+    if len(names) == 1:
+        # attrgetter returns a bare value for a single name and a tuple for several
+        get_one = operator.attrgetter(names[0])
+        return lambda state: (get_one(state),)
+    return operator.attrgetter(*names)
+
+
+def _fields_getter(fields: Sequence[str]) -> Callable[[Any], dict[str, Any]]:
+    """
+    Build a function that extracts the given fields from a state into a dict.
+    """
+    names = tuple(fields)
+    if not names:
+        return _no_fields
+    get_values = _values_getter(names)
+    return lambda state: dict(zip(names, get_values(state), strict=True))
+
+
 class FlowStateGraph(StateGraph[StateT, StateT, StateT]):
     """
     Custom StateGraph for Graflow that provides common patterns and utilities for building flows.
@@ -27,13 +113,20 @@ class FlowStateGraph(StateGraph[StateT, StateT, StateT]):
     ):
         super().__init__(state_schema, config_schema, **kwargs)
         self.flow_name = flow_name
+        # Built once and shared by every compile(); with_config() merges it into a new dict
+        self._run_config: RunnableConfig = {"run_name": flow_name}
+        # Snapshot of the names nodes can read from a state, used to validate node fields once
+        # at registration: its fields plus computed fields, properties and other class attributes
+        self._state_fields = frozenset(state_schema.model_fields).union(
+            state_schema.model_computed_fields, dir(state_schema)
+        )
 
     def compile(self, cache=None, checkpointer=None, store=None):
         """Compile the graph with Graflow defaults."""
         return (
             super()
             .compile(checkpointer=checkpointer, cache=cache, store=store)
-            .with_config({"run_name": self.flow_name})
+            .with_config(self._run_config)
         )
 
     def add_node(  # type: ignore[override]
@@ -52,12 +145,26 @@ class FlowStateGraph(StateGraph[StateT, StateT, StateT]):
         """
         if node_name is None:
             node_name = func.__name__
+        # LangGraph keys its node, channel and trigger tables by node name; interning
+        # generated names lets those lookups short-circuit on identity.
+        node_name = sys.intern(node_name)
 
         wrapped_func = add_logging_to_node(node_name)(func)
 
         super().add_node(node_name, wrapped_func, **kwargs)
         return self  # type: ignore[return-value]
 
+    def _validate_state_fields(self, fields: Sequence[str], owner: str) -> None:
+        """
+        Check that all fields exist in the state schema.
+
+        Raises:
+            ValueError: If a field is not part of the state
+        """
+        for field in fields:
+            if field not in self._state_fields:
+                raise ValueError(f"Field '{field}' not found in state for {owner}")
+
     def add_llm_call_node(
         self, llm_func: Callable[..., Any], result_field: str | None = None, **node_kwargs
     ) -> NamedTuple:
@@ -78,21 +185,23 @@ class FlowStateGraph(StateGraph[StateT, StateT, StateT]):
         if result_field is None:
             result_field = node_name[9:]  # Remove the "generate_" prefix
 
-        sig = inspect.signature(llm_func)
-        func_param_names = list(sig.parameters.keys())
+        func_param_names = _get_param_names(llm_func)
+
+        # Resolve the parameters against the state once; a missing one is reported when the
+        # node runs
+        missing_fields = [
+            param_name for param_name in func_param_names if param_name not in self._state_fields
+        ]
+
+        get_args = _values_getter(func_param_names)
 
         def llm_wrapper(state: StateT) -> StateT:
+            if missing_fields:
+                raise ValueError(
+                    f"Field '{missing_fields[0]}' not found in state for LLM function '{node_name}'"
+                )
             # Extract arguments from state based on llm_func signature
-            func_args = []
-            for param_name in func_param_names:
-                if hasattr(state, param_name):
-                    func_args.append(getattr(state, param_name))
-                else:
-                    raise ValueError(
-                        f"Field '{param_name}' not found in state for LLM function '{node_name}'"
-                    )
-
-            llm_result = llm_func(*func_args)
+            llm_result = llm_func(*get_args(state))
             return {result_field: llm_result}  # type: ignore[return-value]
 
         # Add cache policy for LLM calls using function parameters as cache key
@@ -100,13 +209,13 @@ class FlowStateGraph(StateGraph[StateT, StateT, StateT]):
         cache_ttl = getattr(settings, "GRAFLOW_NODE_CACHE_TTL", 3600)
 
         def create_cache_key_func(state: StateT):
-            # Create a dict with the parameters for cache key
-            cache_params = {}
-            for param_name in func_param_names:
-                if hasattr(state, param_name):
-                    cache_params[param_name] = getattr(state, param_name)
-
-            return create_cache_key_from_fields(node_name, state, func_param_names)
+            # Reuse the argument getter so the parameters are read from the state only once
+            try:
+                values = get_args(state)
+            except AttributeError:
+                # Not a state model (e.g. a dict payload); extract the fields one by one
+                return create_cache_key_from_fields(node_name, state, list(func_param_names))
+            return create_cache_key_from_values(node_name, func_param_names, values)
 
         cache_policy = CachePolicy(ttl=cache_ttl, key_func=create_cache_key_func)
         node_kwargs["cache_policy"] = cache_policy
@@ -137,12 +246,19 @@ class FlowStateGraph(StateGraph[StateT, StateT, StateT]):
         if node_name is None:
             node_name = f"waiting_for_{'_and_'.join(required_fields)}"
 
+        self._validate_state_fields(required_fields, f"node '{node_name}'")
+        if updated_fields:
+            self._validate_state_fields(updated_fields, f"node '{node_name}'")
+
+        required_data = list(required_fields)
+        get_updated_fields = _fields_getter(updated_fields) if updated_fields else None
+
         def data_receiver_func(state: StateT):
-            if updated_fields:
-                state_update = {field: getattr(state, field) for field in updated_fields}
-                received_data = interrupt({**state_update, "required_data": required_fields})
+            if get_updated_fields is not None:
+                state_update = get_updated_fields(state)
+                received_data = interrupt({**state_update, "required_data": required_data})
             else:
-                received_data = interrupt({"required_data": required_fields})
+                received_data = interrupt({"required_data": required_data})
 
             return received_data
 
@@ -169,8 +285,11 @@ class FlowStateGraph(StateGraph[StateT, StateT, StateT]):
         if node_name is None:
             node_name = f"send_{'_and_'.join(updated_fields)}"
 
+        self._validate_state_fields(updated_fields, f"node '{node_name}'")
+        get_updated_fields = _fields_getter(updated_fields)
+
         def send_data_func(state: StateT):
-            interrupt({field: getattr(state, field) for field in updated_fields})
+            interrupt(get_updated_fields(state))
             return {}
 
         self.add_node(func=send_data_func, node_name=node_name, **kwargs)
@@ -1,33 +1,63 @@
 import functools
 import logging
+import sys
 import time
 
 logger = logging.getLogger(__name__)
 
 
-def add_logging_to_node(node_name: str):
-    """decorator for adding logging to every node and action in FlowStateGraph"""
+class _LoggingNodeWrapper:
+    """
+    Callable that wraps a node function with ENTER/EXIT/ERROR logging.
 
-    def decorator(func):
-        @functools.wraps(func)
-        def wrapper(state, *args, **kwargs):
-            logger.info(f"[ENTER] {node_name}")
-            # saving start time
-            start = time.perf_counter()
+    A single shared ``__call__`` replaces a fresh closure per node. ``functools.update_wrapper``
+    copies ``__wrapped__`` and ``__annotations__`` onto the instance, which LangGraph relies on to
+    infer the node's input schema and ``Command`` destinations, so the class keeps a ``__dict__``
+    instead of using ``__slots__``.
+    """
 
-            try:
-                # running inner function
-                result = func(state, *args, **kwargs)
-                # capture end time
-                elapsed = (time.perf_counter() - start) * 1000
-                logger.info(f"[EXIT] {node_name} ({elapsed:.2f} ms)")
+    _ENTER = "[ENTER] %s"
+    _EXIT = "[EXIT] %s (%.2f ms)"
+    _ERROR = "[ERROR] %s (%.2f ms) -> %s: %s"
+    _ERROR_UNTIMED = "[ERROR] %s -> %s: %s"
 
-                return result
+    def __init__(self, func, node_name: str):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.node_name = sys.intern(node_name)
+
+    def __call__(self, state, *args, **kwargs):
+        # Nodes run on every graph tick, so let logging format the messages lazily
+        # and skip the timing entirely when INFO records would be dropped anyway.
+        if not logger.isEnabledFor(logging.INFO):
+            try:
+                return self.func(state, *args, **kwargs)
             except Exception as e:
-                elapsed = (time.perf_counter() - start) * 1000
-                logger.error(f"[ERROR] {node_name} ({elapsed:.2f} ms) -> {type(e).__name__}: {e}")
+                logger.error(self._ERROR_UNTIMED, self.node_name, type(e).__name__, e)
                 raise
 
-        return wrapper
+        logger.info(self._ENTER, self.node_name)
+        # saving start time, in integer nanoseconds; converted to ms only for the log record
+        start = time.perf_counter_ns()
+
+        try:
+            # running inner function
+            result = self.func(state, *args, **kwargs)
+            # capture end time
+            elapsed = (time.perf_counter_ns() - start) / 1e6
+            logger.info(self._EXIT, self.node_name, elapsed)
+
+            return result
+        except Exception as e:
+            elapsed = (time.perf_counter_ns() - start) / 1e6
+            logger.error(self._ERROR, self.node_name, elapsed, type(e).__name__, e)
+            raise
+
+
+def add_logging_to_node(node_name: str):
+    """decorator for adding logging to every node and action in FlowStateGraph"""
+
+    def decorator(func):
+        return _LoggingNodeWrapper(func, node_name)
 
     return decorator
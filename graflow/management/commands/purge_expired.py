@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from graflow.models.langgraph import CacheEntry, Store
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired store items and cache entries. Meant to be scheduled "
+        "(e.g. cron or pg_cron) every few minutes."
+    )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        # Both filters are served by the expires_at indexes (partial B-tree on store, BRIN on
+        # the cache), so a sweep only reads the expired rows.
+        store_count = Store.objects.filter(expires_at__lte=now).delete()[0]
+        cache_count = CacheEntry.objects.filter(expires_at__lte=now).delete()[0]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Purged {store_count} expired store item(s) and {cache_count} cache entry(ies)"
+            )
+        )
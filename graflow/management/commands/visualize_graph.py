@@ -1,3 +1,4 @@
+import hashlib
 import os
 
 from django.conf import settings
@@ -81,10 +82,12 @@ class Command(BaseCommand):
             # Get the graph
             graph = flow_type_obj.get_graph()
 
-            # Create output directory
-            # Use getattr with default to safely access settings
-            media_root = getattr(settings, "MEDIA_ROOT", "./media")
-            output_dir = options["output_dir"] or os.path.join(media_root, "graph_visualizations")
+            # Create output directory, falling back to MEDIA_ROOT only when none was given
+            output_dir = options["output_dir"]
+            if not output_dir:
+                # Use getattr with default to safely access settings
+                media_root = getattr(settings, "MEDIA_ROOT", "./media")
+                output_dir = os.path.join(media_root, "graph_visualizations")
             os.makedirs(output_dir, exist_ok=True)
 
             # Create visualization using LangGraph's built-in methods
@@ -136,7 +139,7 @@ class Command(BaseCommand):
         else:
             # Use LangGraph's Mermaid PNG visualization
             try:
-                png_data = graph.get_graph().draw_mermaid_png()
+                png_data = self.render_mermaid_png(graph.get_graph(), output_dir)
                 with open(output_path, "wb") as f:
                     f.write(png_data)
             except Exception as e:
@@ -149,24 +152,51 @@ class Command(BaseCommand):
 
         return output_path
 
+    def render_mermaid_png(self, drawable_graph, output_dir):
+        """
+        Render the graph's Mermaid diagram to PNG, reusing earlier renders of the same diagram.
+
+        PNG rendering goes through an external Mermaid renderer, while the Mermaid source is
+        generated locally, so renders are cached under output_dir/.cache keyed by a hash of it.
+        """
+        mermaid_source = drawable_graph.draw_mermaid()
+        cache_key = hashlib.blake2b(mermaid_source.encode(), digest_size=16).hexdigest()
+        cache_dir = os.path.join(output_dir, ".cache")
+        cache_path = os.path.join(cache_dir, f"{cache_key}.png")
+
+        if os.path.exists(cache_path):
+            with open(cache_path, "rb") as f:
+                return f.read()
+
+        png_data = drawable_graph.draw_mermaid_png()
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary file first so a concurrent run never reads a partial render
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(png_data)
+        os.replace(tmp_path, cache_path)
+        return png_data
+
     def create_simple_text_visualization(self, graph, graph_name, version, output_path):
         """Create a simple text representation when LangGraph visualization fails."""
         try:
             # Get basic graph structure from the builder
             builder = graph.builder
-            nodes = list(builder.nodes.keys())
-            edges = list(builder.edges)
-
-            # Create simple text representation
-            text_output = f"Graph: {graph_name} (v{version or 'latest'})\n"
-            text_output += "=" * 50 + "\n\n"
-            text_output += f"Nodes ({len(nodes)}):\n"
-            for node in sorted(nodes):
-                text_output += f"  - {node}\n"
-
-            text_output += f"\nEdges ({len(edges)}):\n"
-            for edge in sorted(edges):
-                text_output += f"  {edge[0]} -> {edge[1]}\n"
+            nodes = sorted(builder.nodes)
+            edges = sorted(builder.edges)
+
+            # Create simple text representation, collecting lines to join once
+            lines = [
+                f"Graph: {graph_name} (v{version or 'latest'})",
+                "=" * 50,
+                "",
+                f"Nodes ({len(nodes)}):",
+            ]
+            lines.extend(f"  - {node}" for node in nodes)
+            lines.append("")
+            lines.append(f"Edges ({len(edges)}):")
+            lines.extend(f"  {edge[0]} -> {edge[1]}" for edge in edges)
+            text_output = "\n".join(lines) + "\n"
 
             # Write to file
             with open(output_path, "w") as f:
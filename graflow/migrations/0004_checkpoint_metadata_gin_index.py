@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:20
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0003_flowtype"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="checkpoint",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["metadata"],
+                name="checkpoints_metadata_gin_idx",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0004_checkpoint_metadata_gin_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="flow",
+            index=models.Index(
+                condition=models.Q(("status__in", ["pending", "running", "interrupted"])),
+                fields=["user", "-last_resumed_at"],
+                name="graflow_flow_active_recent_idx",
+            ),
+        ),
+    ]
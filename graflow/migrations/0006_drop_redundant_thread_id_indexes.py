@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:21
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0005_flow_active_recent_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="checkpoint",
+            name="checkpoints_thread_id_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="checkpointblob",
+            name="checkpoint_blobs_thread_id_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="checkpointwrite",
+            name="checkpoint_writes_thrd_id_idx",
+        ),
+    ]
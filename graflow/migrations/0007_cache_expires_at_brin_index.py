@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:22
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0006_drop_redundant_thread_id_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="cacheentry",
+            name="cache_expires_at_idx",
+        ),
+        migrations.AddIndex(
+            model_name="cacheentry",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["expires_at"], name="cache_expires_at_idx", pages_per_range=32
+            ),
+        ),
+    ]
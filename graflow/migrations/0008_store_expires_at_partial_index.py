@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0007_cache_expires_at_brin_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="store",
+            name="store_expires_at_idx",
+        ),
+        migrations.AddIndex(
+            model_name="store",
+            index=models.Index(
+                condition=models.Q(("expires_at__isnull", False)),
+                fields=["expires_at"],
+                name="store_expires_at_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:24
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0008_store_expires_at_partial_index"),
+    ]
+
+    # Serialized channel values are written once and read whole, so store large blobs out of line
+    # without running them through pglz first. Only affects values written after the migration.
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                "ALTER TABLE checkpoint_blobs ALTER COLUMN blob SET STORAGE EXTERNAL;",
+                "ALTER TABLE checkpoint_writes ALTER COLUMN blob SET STORAGE EXTERNAL;",
+            ],
+            reverse_sql=[
+                "ALTER TABLE checkpoint_blobs ALTER COLUMN blob SET STORAGE EXTENDED;",
+                "ALTER TABLE checkpoint_writes ALTER COLUMN blob SET STORAGE EXTENDED;",
+            ],
+        ),
+    ]
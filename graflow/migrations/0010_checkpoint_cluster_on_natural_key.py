@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:31
+
+from django.db import migrations
+
+# The unique_together indexes Django created for the natural (thread_id, checkpoint_ns, ...) keys
+CLUSTER_INDEXES = {
+    "checkpoints": "checkpoints_thread_id_checkpoint_ns_checkpoint_id_0b0e0c77_uniq",
+    "checkpoint_blobs": "checkpoint_blobs_thread_id_checkpoint_ns__94b47467_uniq",
+    "checkpoint_writes": "checkpoint_writes_thread_id_checkpoint_ns__171bb9c2_uniq",
+}
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0009_checkpoint_blob_external_storage"),
+    ]
+
+    # Only records the clustering index, which is a catalog change. The actual CLUSTER rewrites the
+    # table under an exclusive lock, so it is left to maintenance windows (plain `CLUSTER <table>;`
+    # or `clusterdb` then picks these indexes up).
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                f"ALTER TABLE {table} CLUSTER ON {index};"
+                for table, index in CLUSTER_INDEXES.items()
+            ],
+            reverse_sql=[f"ALTER TABLE {table} SET WITHOUT CLUSTER;" for table in CLUSTER_INDEXES],
+        ),
+    ]
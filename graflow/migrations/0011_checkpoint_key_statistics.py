@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:34
+
+from django.db import migrations
+
+# Functional-dependency statistics for the correlated key columns of the checkpoint tables. Every
+# lookup filters on thread_id and checkpoint_ns together (and usually checkpoint_id), which the
+# planner would otherwise treat as independent and multiply into far too low row estimates.
+KEY_STATISTICS = {
+    "checkpoints_key_stats": ("checkpoints", "thread_id, checkpoint_ns, checkpoint_id"),
+    "checkpoint_blobs_key_stats": ("checkpoint_blobs", "thread_id, checkpoint_ns, channel"),
+    "checkpoint_writes_key_stats": ("checkpoint_writes", "thread_id, checkpoint_ns, checkpoint_id"),
+}
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0010_checkpoint_cluster_on_natural_key"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                f"CREATE STATISTICS IF NOT EXISTS {name} (dependencies) ON {columns} FROM {table};"
+                for name, (table, columns) in KEY_STATISTICS.items()
+            ],
+            reverse_sql=[f"DROP STATISTICS IF EXISTS {name};" for name in KEY_STATISTICS],
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0011_checkpoint_key_statistics"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="flow",
+            name="graflow_flo_user_id_d7fe91_idx",
+        ),
+        migrations.AddIndex(
+            model_name="flow",
+            index=models.Index(
+                fields=["app_name", "flow_type", "status"], name="graflow_flow_app_type_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0012_flow_app_type_index"),
+    ]
+
+    # Store items are rewritten in place (value, updated_at) without touching their indexed key
+    # columns, so leaving free space on each page lets Postgres apply those updates as HOT updates
+    # instead of adding new entries to every index. Vacuum more often to prune the HOT chains.
+    operations = [
+        migrations.RunSQL(
+            sql="ALTER TABLE store SET (fillfactor = 80, autovacuum_vacuum_scale_factor = 0.05);",
+            reverse_sql="ALTER TABLE store RESET (fillfactor, autovacuum_vacuum_scale_factor);",
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:38
+
+import django.contrib.postgres.indexes
+import django.core.serializers.json
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0013_store_fillfactor"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="flow",
+            name="latest_state",
+            field=models.JSONField(
+                blank=True,
+                editable=False,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                help_text="Snapshot of the state after the last resume (used for state filtering)",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="flow",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["latest_state"],
+                name="graflow_flow_latest_state_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0014_flow_latest_state"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="flow",
+            name="current_state_name",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Node the flow is interrupted at, as of the last resume",
+                max_length=255,
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,114 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:46
+
+from django.db import migrations, models
+
+# The unique_together constraints Django created, renamed in place to the UniqueConstraint names.
+# Renaming keeps the underlying indexes (and the CLUSTER ON marks from 0010) instead of dropping
+# and rebuilding them on the largest tables.
+RENAMED_CONSTRAINTS = {
+    "store": ("store_prefix_key_99941b0d_uniq", "store_prefix_key_uniq"),
+    "checkpoints": (
+        "checkpoints_thread_id_checkpoint_ns_checkpoint_id_0b0e0c77_uniq",
+        "checkpoints_thread_ns_id_uniq",
+    ),
+    "checkpoint_blobs": (
+        "checkpoint_blobs_thread_id_checkpoint_ns__94b47467_uniq",
+        "checkpoint_blobs_thread_ns_channel_version_uniq",
+    ),
+    "checkpoint_writes": (
+        "checkpoint_writes_thread_id_checkpoint_ns__171bb9c2_uniq",
+        "checkpoint_writes_thread_ns_id_task_idx_uniq",
+    ),
+    "graflow_cache_entry": (
+        "graflow_cache_entry_namespace_key_52c8c5f4_uniq",
+        "cache_namespace_key_uniq",
+    ),
+}
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0015_flow_current_state_name"),
+    ]
+
+    operations = [
+        # Both are the leading column of their table's unique constraint
+        migrations.RemoveIndex(
+            model_name="cacheentry",
+            name="cache_namespace_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="store",
+            name="store_prefix_idx",
+        ),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql=[
+                        f"ALTER TABLE {table} RENAME CONSTRAINT {old} TO {new};"
+                        for table, (old, new) in RENAMED_CONSTRAINTS.items()
+                    ],
+                    reverse_sql=[
+                        f"ALTER TABLE {table} RENAME CONSTRAINT {new} TO {old};"
+                        for table, (old, new) in RENAMED_CONSTRAINTS.items()
+                    ],
+                ),
+            ],
+            state_operations=[
+                migrations.AlterUniqueTogether(
+                    name="cacheentry",
+                    unique_together=set(),
+                ),
+                migrations.AlterUniqueTogether(
+                    name="checkpoint",
+                    unique_together=set(),
+                ),
+                migrations.AlterUniqueTogether(
+                    name="checkpointblob",
+                    unique_together=set(),
+                ),
+                migrations.AlterUniqueTogether(
+                    name="checkpointwrite",
+                    unique_together=set(),
+                ),
+                migrations.AlterUniqueTogether(
+                    name="store",
+                    unique_together=set(),
+                ),
+                migrations.AddConstraint(
+                    model_name="cacheentry",
+                    constraint=models.UniqueConstraint(
+                        fields=("namespace", "key"), name="cache_namespace_key_uniq"
+                    ),
+                ),
+                migrations.AddConstraint(
+                    model_name="checkpoint",
+                    constraint=models.UniqueConstraint(
+                        fields=("thread_id", "checkpoint_ns", "checkpoint_id"),
+                        name="checkpoints_thread_ns_id_uniq",
+                    ),
+                ),
+                migrations.AddConstraint(
+                    model_name="checkpointblob",
+                    constraint=models.UniqueConstraint(
+                        fields=("thread_id", "checkpoint_ns", "channel", "version"),
+                        name="checkpoint_blobs_thread_ns_channel_version_uniq",
+                    ),
+                ),
+                migrations.AddConstraint(
+                    model_name="checkpointwrite",
+                    constraint=models.UniqueConstraint(
+                        fields=("thread_id", "checkpoint_ns", "checkpoint_id", "task_id", "idx"),
+                        name="checkpoint_writes_thread_ns_id_task_idx_uniq",
+                    ),
+                ),
+                migrations.AddConstraint(
+                    model_name="store",
+                    constraint=models.UniqueConstraint(
+                        fields=("prefix", "key"), name="store_prefix_key_uniq"
+                    ),
+                ),
+            ],
+        ),
+    ]
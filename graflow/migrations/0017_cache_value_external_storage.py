@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:50
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0016_unique_constraints"),
+    ]
+
+    # Cached node results go through the same serializer as checkpoint blobs (see 0009) and are
+    # read on the hot path of every cached node, so store large ones out of line without pglz.
+    # Only affects values written after the migration.
+    operations = [
+        migrations.RunSQL(
+            sql="ALTER TABLE graflow_cache_entry ALTER COLUMN value_data SET STORAGE EXTERNAL;",
+            reverse_sql=(
+                "ALTER TABLE graflow_cache_entry ALTER COLUMN value_data SET STORAGE EXTENDED;"
+            ),
+        ),
+    ]
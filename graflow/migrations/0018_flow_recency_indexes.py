@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0017_cache_value_external_storage"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    # The full (user, -last_resumed_at) index also serves the in-progress listing, so the partial
+    # index over the same columns would only add write cost on every resume.
+    operations = [
+        migrations.RemoveIndex(
+            model_name="flow",
+            name="graflow_flow_active_recent_idx",
+        ),
+        migrations.AddIndex(
+            model_name="flow",
+            index=models.Index(
+                fields=["user", "-last_resumed_at"], name="graflow_flow_user_recent_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="flow",
+            index=models.Index(fields=["-last_resumed_at"], name="graflow_flow_recent_idx"),
+        ),
+    ]
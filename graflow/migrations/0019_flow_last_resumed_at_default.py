@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:58
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("graflow", "0018_flow_recency_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="flow",
+            name="last_resumed_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -1,10 +1,17 @@
+import json
 import logging
+import math
+from collections import deque
 from typing import TYPE_CHECKING, Any
 
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.utils import timezone
 from django.utils.functional import cached_property
 from langgraph.types import Command
+from pydantic import BaseModel
 
 from graflow.models.registry import FlowType
 
@@ -12,12 +19,69 @@ logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
+# LangGraph internal fields and flow-level fields removed from states returned to clients
+_INTERNAL_STATE_KEYS = frozenset({"__interrupt__", "user_id", "flow_id", "initial_input_received"})
+_INTERNAL_STATE_PREFIXES = ("branch:to:", "_")
+
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
 
     UserType = AbstractUser
 
 
+def _contains_pydantic(data: Any) -> bool:
+    """
+    Return True if a Pydantic model is nested anywhere in dicts, lists or tuples of ``data``.
+    """
+    stack = deque([data])
+    while stack:
+        value = stack.pop()
+        if isinstance(value, BaseModel):
+            return True
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def _to_json_value(value: Any) -> Any:
+    """
+    Return ``value`` as it reads back from a ``latest_state`` column (DjangoJSONEncoder).
+
+    Datetimes become ISO strings and tuples become lists. Values that cannot be encoded fall
+    back to their ``str()``.
+    """
+    try:
+        return json.loads(json.dumps(value, cls=DjangoJSONEncoder))
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def _json_contains(container: Any, contained: Any) -> bool:
+    """
+    Evaluate jsonb's ``container @> contained`` on decoded JSON values.
+
+    Objects match key by key, every element of an array must be contained in some element of
+    the other array, and scalars must be equal JSON values (numbers by value, bools distinct
+    from numbers).
+    """
+    if isinstance(contained, dict):
+        return isinstance(container, dict) and all(
+            key in container and _json_contains(container[key], value)
+            for key, value in contained.items()
+        )
+    if isinstance(contained, list):
+        return isinstance(container, list) and all(
+            any(_json_contains(item, value) for item in container) for value in contained
+        )
+    if isinstance(contained, bool) or isinstance(container, bool):
+        return container is contained
+    if isinstance(contained, (int, float)):
+        return isinstance(container, (int, float)) and container == contained
+    return type(container) is type(contained) and container == contained
+
+
 class FlowQuerySet(models.QuerySet):
     def for_user(self, user: "UserType"):
         """
@@ -68,6 +132,24 @@ class FlowQuerySet(models.QuerySet):
             status__in=[Flow.STATUS_PENDING, Flow.STATUS_RUNNING, Flow.STATUS_INTERRUPTED]
         )
 
+    def lightweight(self):
+        """
+        Defer the columns listing pages never render (error messages and state snapshots).
+
+        Returns:
+            FlowQuerySet: Queryset with heavy fields deferred (chainable)
+        """
+        return self.defer("error_message", "latest_state")
+
+    def prefetch_states(self) -> list["Flow"]:
+        """
+        Evaluate the queryset and read the graph snapshots of all its flows in one query.
+
+        Returns:
+            List of Flow instances with their snapshots loaded (see prefetch_flow_states).
+        """
+        return prefetch_flow_states(self)
+
     def by_recency(self):
         """
         Order flows by most recently resumed first.
@@ -77,10 +159,35 @@ class FlowQuerySet(models.QuerySet):
         """
         return self.order_by("-last_resumed_at")
 
+    def cancel_if_active(self) -> int:
+        """
+        Cancel all in-progress flows in this queryset with a single UPDATE.
+
+        Returns:
+            int: Number of flows that were cancelled
+        """
+        return self.in_progress().update(status=Flow.STATUS_CANCELLED)
+
+    def mark_running(self) -> int:
+        """
+        Move all resumable (pending or interrupted) flows in this queryset to RUNNING with a
+        single UPDATE, stamping ``last_resumed_at``.
+
+        Returns:
+            int: Number of flows that were marked running
+        """
+        return self.filter(status__in=[Flow.STATUS_PENDING, Flow.STATUS_INTERRUPTED]).update(
+            status=Flow.STATUS_RUNNING, last_resumed_at=timezone.now()
+        )
+
     def filter_by_state(self, **state_filters):
         """
         Filter flows by state field values.
 
+        Flows with a stored state snapshot (``Flow.latest_state``) are matched in the database;
+        only flows resumed before the snapshot existed fall back to reading their state from the
+        checkpointer.
+
         Args:
             **state_filters: Keyword arguments where keys are field paths (using double underscores
                            for nested fields) and values are the expected values.
@@ -101,48 +208,143 @@ class FlowQuerySet(models.QuerySet):
         if not state_filters:
             return list(self)
 
+        snapshot_match = models.Q()
+        for field_path, expected_value in state_filters.items():
+            snapshot_match &= self._state_containment_q(field_path, expected_value)
+
+        # Pending flows have no checkpoint yet, so they can only match through a snapshot
+        without_snapshot = models.Q(latest_state__isnull=True) & ~models.Q(
+            status=Flow.STATUS_PENDING
+        )
+
+        # Only the presence of a snapshot is needed here, so don't load it (it may be deferred)
+        flows = self.filter(snapshot_match | without_snapshot).annotate(
+            has_state_snapshot=models.ExpressionWrapper(
+                models.Q(latest_state__isnull=False), output_field=models.BooleanField()
+            )
+        )
+        # Split paths once for all rows; deeper (usually more selective) paths are checked first
+        prepared_filters = sorted(
+            (
+                (field_path.split("__"), expected_value)
+                for field_path, expected_value in state_filters.items()
+            ),
+            key=lambda item: -len(item[0]),
+        )
+        # Stream the candidates instead of caching them all on the queryset; only matches are kept
         filtered_flows = []
-        for flow in self:
-            if self._matches_state_filters(flow.state, state_filters):
+        for flow in flows.iterator(chunk_size=500):
+            if flow.has_state_snapshot or self._matches_state_filters(flow.state, prepared_filters):
                 filtered_flows.append(flow)
         return filtered_flows
 
     @staticmethod
-    def _matches_state_filters(state: dict, filters: dict) -> bool:
+    def _state_number(text: str) -> int | float | None:
+        """
+        Return the JSON number a filter string stands for, or None if it is not one.
+
+        Strings count only when they are the number's own ``str()`` (e.g. "43" or "1.5").
+        """
+        for number_type in (int, float):
+            try:
+                number = number_type(text)
+            except ValueError:
+                continue
+            # JSON has no NaN/Infinity, and str() of them never came from a stored value anyway
+            if str(number) == text and math.isfinite(number):
+                return number
+        return None
+
+    @staticmethod
+    def _state_filter_values(expected_value: Any) -> list[Any]:
+        """
+        Build the JSON values a state field must contain to match one filter.
+
+        The expected value is compared in its stored JSON form (e.g. datetimes as ISO strings).
+        Objects and arrays match by containment. A scalar matches every JSON scalar with the
+        same text, so "43" matches both "43" and 43, "True" matches true, and numbers compare
+        by value (1 matches 1.0).
+        """
+        expected = _to_json_value(expected_value)
+        if isinstance(expected, (dict, list)):
+            return [expected]
+
+        text = expected if isinstance(expected, str) else str(expected)
+        values: list[Any] = [text]
+        if text in ("True", "False"):
+            values.append(text == "True")
+        number = FlowQuerySet._state_number(text)
+        if number is not None:
+            values.append(number)
+        return values
+
+    @staticmethod
+    def _state_filter_candidates(fields: list[str], expected_value: Any) -> list[dict]:
+        """
+        Build the JSON documents a state must contain to match one filter.
+
+        Each of ``_state_filter_values`` is nested under the field path, so the database lookup
+        and the Python fallback test the same values.
+        """
+        documents = []
+        for candidate in FlowQuerySet._state_filter_values(expected_value):
+            for field in reversed(fields):
+                candidate = {field: candidate}
+            documents.append(candidate)
+        return documents
+
+    @staticmethod
+    def _state_containment_q(field_path: str, expected_value: Any) -> models.Q:
+        """
+        Build the ``latest_state`` lookup for one filter (see ``_state_filter_candidates``).
+
+        Containment (@>) keeps each candidate answerable from the GIN index on ``latest_state``.
+        """
+        match = models.Q()
+        for document in FlowQuerySet._state_filter_candidates(
+            field_path.split("__"), expected_value
+        ):
+            match |= models.Q(latest_state__contains=document)
+        return match
+
+    @staticmethod
+    def _matches_state_filters(state: dict, filters: list[tuple[list[str], Any]]) -> bool:
         """
         Check if a flow's state matches all provided filters.
 
         Args:
             state: The flow's state dictionary
-            filters: Dictionary of field_path: expected_value pairs
+            filters: List of (field path split on "__", expected value) pairs
 
         Returns:
             bool: True if state matches all filters, False otherwise
 
         Note:
             - Supports nested field paths using double underscores (e.g., "data__title")
-            - Uses string comparison to handle type coercion
+            - Matches like the ``latest_state`` lookup: the field is read in its stored JSON
+              form and must contain one of ``_state_filter_values``
+            - Only the field itself is encoded, so other fields that have no JSON form (sets,
+              bytes, ...) don't affect the match
             - Returns False if state is None or any field is missing
         """
         if state is None:
             return False
 
-        for field_path, expected_value in filters.items():
-            # Navigate nested fields
+        for fields, expected_value in filters:
             current_value: Any = state
-            for field in field_path.split("__"):
-                if isinstance(current_value, dict):
-                    current_value = current_value.get(field)
-                else:
+            for field in fields:
+                if not isinstance(current_value, dict):
                     return False
-
+                current_value = current_value.get(field)
                 if current_value is None:
                     return False
 
-            # Convert to string for comparison to handle different types
-            if str(current_value) != str(expected_value):
+            current_value = _to_json_value(current_value)
+            if not any(
+                _json_contains(current_value, value)
+                for value in FlowQuerySet._state_filter_values(expected_value)
+            ):
                 return False
-
         return True
 
     def filter_by_flow_type_permissions(self, request, view, permission_type: str = "crud"):
@@ -158,36 +360,7 @@ class FlowQuerySet(models.QuerySet):
         Returns:
             List of Flow instances where user has permission
         """
-        from graflow.models.registry import FlowType
-
-        # Convert queryset to list to iterate
-        flows_list = list(self)
-
-        # Group flows by (app_name, flow_type) for efficient permission checking
-        flow_type_keys = {}
-        for flow in flows_list:
-            key = (flow.app_name, flow.flow_type)
-            if key not in flow_type_keys:
-                flow_type_keys[key] = []
-            flow_type_keys[key].append(flow)
-
-        # Check permissions for each flow object individually (object-level permission check)
-        allowed_flows = []
-        for (app_name, flow_type_name), flow_list in flow_type_keys.items():
-            try:
-                flow_type_obj = FlowType.objects.get_latest(app_name, flow_type_name)
-                if flow_type_obj:
-                    permission = flow_type_obj.get_permission_instance(permission_type)
-                    # Check object-level permission for each flow
-                    for flow in flow_list:
-                        if permission.has_object_permission(request, view, flow):
-                            allowed_flows.append(flow)
-            except Exception as e:
-                logger.warning(f"Error checking permission for {app_name}:{flow_type_name}: {e}")
-                # On error, skip these flows (fail secure)
-                continue
-
-        return allowed_flows
+        return _filter_permitted_flows(list(self), request, view, permission_type)
 
 
 def filter_flows_by_permissions(flows, request, view, permission_type: str = "crud"):
@@ -209,35 +382,111 @@ def filter_flows_by_permissions(flows, request, view, permission_type: str = "cr
         return flows.filter_by_flow_type_permissions(request, view, permission_type)
 
     # If it's already a list, use the same logic
-    from graflow.models.registry import FlowType
+    return _filter_permitted_flows(flows, request, view, permission_type)
 
+
+def _filter_permitted_flows(flows, request, view, permission_type: str) -> list["Flow"]:
+    """
+    Check each flow against the permission class of its flow type's latest version.
+    """
     # Group flows by (app_name, flow_type) for efficient permission checking
     flow_type_keys = {}
     for flow in flows:
-        key = (flow.app_name, flow.flow_type)
-        if key not in flow_type_keys:
-            flow_type_keys[key] = []
-        flow_type_keys[key].append(flow)
+        flow_type_keys.setdefault((flow.app_name, flow.flow_type), []).append(flow)
+
+    try:
+        latest_flow_types = FlowType.objects.latest_by_key(flow_type_keys)
+    except Exception as e:
+        logger.warning("Error loading flow types for permission checks: %s", e)
+        # On error, skip all flows (fail secure)
+        return []
 
     # Check permissions for each flow object individually (object-level permission check)
     allowed_flows = []
     for (app_name, flow_type_name), flow_list in flow_type_keys.items():
+        flow_type_obj = latest_flow_types.get((app_name, flow_type_name))
+        if flow_type_obj is None:
+            continue
         try:
-            flow_type_obj = FlowType.objects.get_latest(app_name, flow_type_name)
-            if flow_type_obj:
-                permission = flow_type_obj.get_permission_instance(permission_type)
-                # Check object-level permission for each flow
-                for flow in flow_list:
-                    if permission.has_object_permission(request, view, flow):
-                        allowed_flows.append(flow)
+            permission = flow_type_obj.get_permission_instance(permission_type)
+            # Check object-level permission for each flow
+            for flow in flow_list:
+                if permission.has_object_permission(request, view, flow):
+                    allowed_flows.append(flow)
         except Exception as e:
-            logger.warning(f"Error checking permission for {app_name}:{flow_type_name}: {e}")
+            logger.warning("Error checking permission for %s:%s: %s", app_name, flow_type_name, e)
             # On error, skip these flows (fail secure)
             continue
 
     return allowed_flows
 
 
+def _attach_flow_types(flows: list["Flow"]) -> None:
+    """
+    Resolve the FlowType of every flow with a single query, sharing one instance per version.
+    """
+    missing = [flow for flow in flows if "flow_type_obj" not in vars(flow)]
+    keys = {(flow.app_name, flow.flow_type, flow.graph_version) for flow in missing}
+    if not keys:
+        return
+
+    version_filter = models.Q()
+    for app_name, name, version in keys:
+        version_filter |= models.Q(app_name=app_name, flow_type=name, version=version)
+    flow_types = {
+        (flow_type.app_name, flow_type.flow_type, flow_type.version): flow_type
+        for flow_type in FlowType.objects.filter(version_filter)
+    }
+    for flow in missing:
+        resolved = flow_types.get((flow.app_name, flow.flow_type, flow.graph_version))
+        if resolved is not None:
+            # Fills the flow_type_obj cached_property (flows of unknown versions keep raising)
+            flow.flow_type_obj = resolved
+
+
+def prefetch_flow_states(flows) -> list["Flow"]:
+    """
+    Read the graph snapshots (and FlowTypes) of many flows with one query each.
+
+    Flow.state and get_current_state_name() then use the prefetched snapshots instead of reading
+    the checkpointer once per flow.
+
+    Args:
+        flows: Iterable of Flow instances (queryset or list)
+
+    Returns:
+        List of the same Flow instances with their snapshots loaded.
+    """
+    from graflow.storage import get_storage_components
+    from graflow.storage.checkpointer import DjangoSaver
+
+    flows = list(flows)
+    _attach_flow_types(flows)
+    checkpointer = get_storage_components()[1]
+    if not flows or not isinstance(checkpointer, DjangoSaver):
+        # In-memory checkpointers have no round trips to save
+        return flows
+
+    tuples = checkpointer.get_latest_tuples(str(flow.pk) for flow in flows)
+    with checkpointer.prefetched_tuples(tuples):
+        for flow in flows:
+            try:
+                flow._get_snapshot()
+            except Exception:
+                # Flow.state logs the error when the snapshot is actually read
+                continue
+    return flows
+
+
+_FlowManagerBase = models.Manager.from_queryset(FlowQuerySet)
+
+
+class FlowManager(_FlowManagerBase):
+    def get_queryset(self):
+        # Flow.__str__, admin listings and permission checks all read flow.user
+        return super().get_queryset().select_related("user")
+
+
 class Flow(models.Model):
     STATUS_PENDING = "pending"  # Created, not yet invoked
     STATUS_RUNNING = "running"  # Graph actively executing
@@ -273,21 +522,62 @@ class Flow(models.Model):
     status = models.CharField(max_length=255, default=STATUS_PENDING, choices=STATUS_CHOICES)
     error_message = models.TextField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
-    last_resumed_at = models.DateTimeField(auto_now=True)
+    last_resumed_at = models.DateTimeField(default=timezone.now)
+    current_state_name = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Node the flow is interrupted at, as of the last resume",
+    )
+    latest_state = models.JSONField(
+        null=True,
+        blank=True,
+        editable=False,
+        encoder=DjangoJSONEncoder,
+        help_text="Snapshot of the state after the last resume (used for state filtering)",
+    )
 
     class Meta:
         db_table = "graflow_flow"
         indexes = [
-            models.Index(fields=["user", "app_name", "flow_type"]),
+            # Per-user access goes through the user_id FK index; this one serves the admin and
+            # analytics filters on flow type (and status) across all users.
+            models.Index(
+                fields=["app_name", "flow_type", "status"], name="graflow_flow_app_type_idx"
+            ),
+            # Flow listings show one user's flows, most recently resumed first; the ordering lets
+            # them read the index in order without a sort. In-progress listings (the default)
+            # check the status during the same index scan.
+            models.Index(fields=["user", "-last_resumed_at"], name="graflow_flow_user_recent_idx"),
+            # The admin changelist pages through every flow by recency.
+            models.Index(fields=["-last_resumed_at"], name="graflow_flow_recent_idx"),
+            # filter_by_state matches snapshots with @> containment only (see jsonb_path_ops on
+            # the checkpoint metadata index).
+            GinIndex(
+                fields=["latest_state"],
+                name="graflow_flow_latest_state_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
         ]
 
-    objects = FlowQuerySet.as_manager()
+    objects = FlowManager()
 
     def __str__(self):
         flow_info = f"{self.app_name}:{self.flow_type}:{self.graph_version}"
         user_info = f", user={self.user.username}" if self.user else ", background flow"
         return f"Flow({flow_info}{user_info})"
 
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        """
+        Reload the flow, including the graph snapshot (another request may have resumed it).
+        Partial reloads, e.g. of deferred fields, keep the snapshot.
+        """
+        if fields is None:
+            vars(self).pop("_snapshot_cache", None)
+            vars(self).pop("_current_state_name_cache", None)
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+
     def is_terminal(self):
         """Check if flow is in a terminal state (i.e. cannot be resumed)."""
         return self.status in [Flow.STATUS_COMPLETED, Flow.STATUS_FAILED, Flow.STATUS_CANCELLED]
@@ -302,7 +592,7 @@ class Flow(models.Model):
         if self.is_terminal():
             raise ValueError(f"Cannot cancel flow in terminal state: {self.status}")
         self.status = Flow.STATUS_CANCELLED
-        self.save()
+        self.save(update_fields=["status"])
 
     def mark_cancelled(self):
         """
@@ -316,28 +606,26 @@ class Flow(models.Model):
             self.save(update_fields=["status"])
 
     @cached_property
-    def graph(self):
+    def flow_type_obj(self) -> FlowType:
+        """
+        The FlowType this flow was created from (resolved once, shared by graph and state lookups).
+        """
         try:
-            flow_type_obj = FlowType.objects.get(
+            return FlowType.objects.get(
                 app_name=self.app_name, flow_type=self.flow_type, version=self.graph_version
             )
         except FlowType.DoesNotExist as e:
             raise ValueError(
                 f"FlowType not found for {self.app_name}:{self.flow_type}:{self.graph_version}"
             ) from e
-        return flow_type_obj.get_graph()
+
+    @cached_property
+    def graph(self):
+        return self.flow_type_obj.get_graph()
 
     @cached_property
     def graph_state_definition(self):
-        try:
-            flow_type_obj = FlowType.objects.get(
-                app_name=self.app_name, flow_type=self.flow_type, version=self.graph_version
-            )
-        except FlowType.DoesNotExist as e:
-            raise ValueError(
-                f"FlowType not found for {self.app_name}:{self.flow_type}:{self.graph_version}"
-            ) from e
-        return flow_type_obj.get_state_definition()
+        return self.flow_type_obj.get_state_definition()
 
     @property
     def state(self):
@@ -345,10 +633,8 @@ class Flow(models.Model):
         Retrieve the state snapshot without invoking the graph.
         """
         try:
-            config = {"configurable": {"thread_id": str(self.pk)}}
-
             # Get state from graph (includes interrupt metadata)
-            graph_state = self.graph.get_state(config)
+            graph_state = self._get_snapshot()
 
             if graph_state and graph_state.values:
                 # Convert any Pydantic models in the state to proper JSON objects
@@ -358,24 +644,23 @@ class Flow(models.Model):
                 current_state_name = self._infer_current_state_name_from_snapshot(graph_state)
 
                 # Merge interrupt values from tasks (useful for Postgres checkpointer)
-                if hasattr(graph_state, "tasks") and graph_state.tasks:
-                    for task in graph_state.tasks:
-                        if hasattr(task, "interrupts") and task.interrupts:
-                            # Fallback to task.name if we still don't have a node
+                for task in getattr(graph_state, "tasks", None) or ():
+                    task_interrupts = getattr(task, "interrupts", None)
+                    if task_interrupts:
+                        # Fallback to task.name if we still don't have a node
+                        if current_state_name is None:
+                            current_state_name = getattr(task, "name", None)
+                        for interrupt in task_interrupts:
+                            # Extract node name from interrupt for backwards compatibility
                             if current_state_name is None:
-                                current_state_name = getattr(task, "name", None)
-                            for interrupt in task.interrupts:
-                                # Extract node name from interrupt for backwards compatibility
-                                if current_state_name is None:
-                                    current_state_name = (
-                                        self._extract_current_state_name_from_interrupt(interrupt)
-                                    )
-                                # Merge interrupt value into state
-                                if hasattr(interrupt, "value") and isinstance(
-                                    interrupt.value, dict
-                                ):
-                                    current_state.update(interrupt.value)
-                                    break
+                                current_state_name = (
+                                    self._extract_current_state_name_from_interrupt(interrupt)
+                                )
+                            # Merge interrupt value into state
+                            interrupt_value = getattr(interrupt, "value", None)
+                            if isinstance(interrupt_value, dict):
+                                current_state = {**current_state, **interrupt_value}
+                                break
 
                 # If we didn't get current_state_name from tasks, try extracting from raw state
                 # values (for memory backend, interrupts are stored in state values as
@@ -406,14 +691,31 @@ class Flow(models.Model):
                 self._current_state_name_cache = None
                 return None
         except Exception as e:
-            logger.error(f"Error retrieving graph state for flow {self.pk}: {e}", exc_info=True)
+            logger.error("Error retrieving graph state for flow %s: %s", self.pk, e, exc_info=True)
             self._current_state_name_cache = None
             return None
 
+    def _get_snapshot(self):
+        """
+        Return the latest graph StateSnapshot, fetched from the checkpointer once per instance.
+
+        ``state`` and ``get_current_state_name()`` are usually both read when serializing a flow;
+        ``resume()`` drops the cached snapshot once the graph has moved on.
+        """
+        if not hasattr(self, "_snapshot_cache"):
+            config = {"configurable": {"thread_id": str(self.pk)}}
+            self._snapshot_cache = self.graph.get_state(config)
+        return self._snapshot_cache
+
     def get_current_state_name(self):
         """
-        Get the current state name inferred from the latest graph snapshot.
+        Get the current state name, as stored by the last resume().
+
+        Interrupted flows without a stored name (e.g. resumed before the column existed) fall back
+        to inferring it from the latest graph snapshot.
         """
+        if self.current_state_name is not None or self.status != Flow.STATUS_INTERRUPTED:
+            return self.current_state_name
         try:
             if hasattr(self, "_current_state_name_cache"):
                 return self._current_state_name_cache
@@ -429,7 +731,9 @@ class Flow(models.Model):
             self._current_state_name_cache = current_state_name
             return current_state_name
         except Exception as e:
-            logger.error(f"Error getting current state name for flow {self.pk}: {e}", exc_info=True)
+            logger.error(
+                "Error getting current state name for flow %s: %s", self.pk, e, exc_info=True
+            )
             return None
 
     def _get_current_state_name_from_state(self, current_state):
@@ -458,11 +762,10 @@ class Flow(models.Model):
                     return current_state_name
 
         # Fallback: check if current_state has interrupts attribute (for object-like state)
-        if hasattr(current_state, "interrupts") and current_state.interrupts:
-            for interrupt in current_state.interrupts:
-                current_state_name = self._extract_current_state_name_from_interrupt(interrupt)
-                if current_state_name:
-                    return current_state_name
+        for interrupt in getattr(current_state, "interrupts", None) or ():
+            current_state_name = self._extract_current_state_name_from_interrupt(interrupt)
+            if current_state_name:
+                return current_state_name
 
         return None
 
@@ -474,10 +777,7 @@ class Flow(models.Model):
             Exception: If graph execution fails (status set to FAILED)
         """
         # Atomically transition to RUNNING if currently pending or interrupted.
-        updated = Flow.objects.filter(
-            pk=self.pk, status__in=[Flow.STATUS_PENDING, Flow.STATUS_INTERRUPTED]
-        ).update(status=Flow.STATUS_RUNNING)
-        if updated == 0:
+        if not Flow.objects.filter(pk=self.pk).mark_running():
             self.refresh_from_db()
             if self.is_terminal():
                 raise ValueError(f"Cannot resume flow in terminal state: {self.status}")
@@ -504,6 +804,8 @@ class Flow(models.Model):
             else:
                 # First invocation (from pending state)
                 result_state = self.graph.invoke(submitted_state, config=config)
+            # The graph has moved on; any snapshot read before this run is stale
+            vars(self).pop("_snapshot_cache", None)
 
             # Check if the graph was interrupted and update status accordingly
             has_interrupt = result_state is not None and "__interrupt__" in result_state
@@ -512,14 +814,21 @@ class Flow(models.Model):
             else:
                 self.status = Flow.STATUS_COMPLETED
 
-            self.save()
-
             current_state_name = None
             if has_interrupt:
                 # Fetch latest snapshot to determine the current state name
-                graph_state = self.graph.get_state(config)
+                graph_state = self._get_snapshot()
                 current_state_name = self._infer_current_state_name_from_snapshot(graph_state)
-            self._current_state_name_cache = current_state_name
+            self.current_state_name = current_state_name
+
+            # Same shape as Flow.state, kept so filter_by_state can run in the database
+            self.latest_state = self._state_snapshot(
+                self._prepare_state(self._convert_pydantic_models(result_state))
+            )
+            self.last_resumed_at = timezone.now()
+            self.save(
+                update_fields=["status", "current_state_name", "latest_state", "last_resumed_at"]
+            )
 
             # When there's an interrupt, return only interrupt data (not full state)
             result_state = self._prepare_state(
@@ -531,27 +840,73 @@ class Flow(models.Model):
             # Mark flow as failed and store error message
             self.status = Flow.STATUS_FAILED
             self.error_message = str(e)
-            self.save()
+            # The checkpointer may have moved past the last snapshot; read it live instead
+            self.latest_state = None
+            self.current_state_name = None
+            vars(self).pop("_snapshot_cache", None)
+            self.last_resumed_at = timezone.now()
+            self.save(
+                update_fields=[
+                    "status",
+                    "error_message",
+                    "current_state_name",
+                    "latest_state",
+                    "last_resumed_at",
+                ]
+            )
             raise
 
+    @staticmethod
+    def _state_snapshot(state):
+        """
+        Return the part of the state that can be stored in ``latest_state``.
+
+        Top-level fields without a JSON form (sets, bytes, ...) are left out, so filters on the
+        remaining fields still run in the database. Non-dict states are kept only if they encode
+        as a whole, otherwise None.
+        """
+        if not isinstance(state, dict):
+            try:
+                json.dumps(state, cls=DjangoJSONEncoder)
+            except (TypeError, ValueError):
+                return None
+            return state
+
+        snapshot = {}
+        for key, value in state.items():
+            try:
+                json.dumps(value, cls=DjangoJSONEncoder)
+            except (TypeError, ValueError):
+                continue
+            snapshot[key] = value
+        return snapshot
+
     def _convert_pydantic_models(self, data):
         """
-        Recursively convert Pydantic models to dictionaries.
-        """
-        if hasattr(data, "model_dump"):
-            # It's a Pydantic model, convert to dict with mode='python'
-            # to ensure proper serialization
-            return data.model_dump(mode="python")
-        elif isinstance(data, dict):
-            # Convert all values in the dict
-            return {k: self._convert_pydantic_models(v) for k, v in data.items()}
-        elif isinstance(data, (list, tuple)):
-            # Convert all items in the list/tuple
-            return [self._convert_pydantic_models(item) for item in data]
-        else:
-            # Return as-is for primitive types
+        Convert Pydantic models nested in the state to dictionaries.
+
+        States without any model (the common case) are returned as-is, so callers must not mutate
+        the result in place. Otherwise containers are copied on the way down, with tuples becoming
+        lists.
+        """
+        if not _contains_pydantic(data):
             return data
 
+        root = [data]
+        stack = [(root, 0, data)]
+        while stack:
+            parent, key, value = stack.pop()
+            if isinstance(value, BaseModel):
+                # mode='python' to ensure proper serialization
+                parent[key] = value.model_dump(mode="python")
+            elif isinstance(value, dict):
+                parent[key] = converted = dict(value)
+                stack.extend((converted, k, v) for k, v in converted.items())
+            elif isinstance(value, (list, tuple)):
+                parent[key] = converted = list(value)
+                stack.extend((converted, i, v) for i, v in enumerate(converted))
+        return root[0]
+
     def _prepare_state(
         self, state, skip_interrupt_extraction=False, interrupt_only=False, current_state_name=None
     ):
@@ -565,20 +920,21 @@ class Flow(models.Model):
             "data (don't merge with full state)
             current_state_name: Pre-computed current state name (to avoid recursion)
         """
-        # Check for interrupt and extract its value (only if not already extracted)
-        if not skip_interrupt_extraction and state and "__interrupt__" in state:
-            interrupts = state.get("__interrupt__", [])
-            if isinstance(interrupts, tuple):
-                interrupts = list(interrupts)
-            if interrupts and len(interrupts) > 0:
-                interrupt_value = interrupts[0].value if hasattr(interrupts[0], "value") else {}
-                if isinstance(interrupt_value, dict):
-                    if interrupt_only:
-                        # Return ONLY interrupt data, not merged with full state
-                        state = interrupt_value.copy()
-                    else:
-                        # Merge interrupt value into the state
-                        state.update(interrupt_value)
+        if not isinstance(state, dict):
+            return state
+
+        # Check for interrupt and extract its value (only if not already extracted). The caller's
+        # dict is not modified; __interrupt__ itself is dropped with the other internal fields.
+        interrupts = None if skip_interrupt_extraction else state.get("__interrupt__")
+        if interrupts:
+            interrupt_value = getattr(interrupts[0], "value", {})
+            if isinstance(interrupt_value, dict):
+                if interrupt_only:
+                    # Return ONLY interrupt data, not merged with full state
+                    state = interrupt_value.copy()
+                else:
+                    # Merge interrupt value into the state
+                    state = {**state, **interrupt_value}
 
         # Clean up LangGraph internal fields
         state = self._clean_internal_fields(state)
@@ -595,28 +951,20 @@ class Flow(models.Model):
         if not isinstance(state, dict):
             return state
 
-        # Filter out internal LangGraph keys and application-specific fields
         cleaned_state = {
             k: v
             for k, v in state.items()
-            if k != "__interrupt__"
-            and not k.startswith("branch:to:")
-            and not k.startswith("_")  # Remove internal fields with underscore prefix
-            and k
-            not in [
-                "user_id",
-                "flow_id",
-                "initial_input_received",
-            ]  # Remove flow-level and internal tracking fields
+            if k not in _INTERNAL_STATE_KEYS and not k.startswith(_INTERNAL_STATE_PREFIXES)
         }
 
         return cleaned_state
 
     def _extract_current_state_name_from_interrupt(self, interrupt) -> str | None:
         """Extract the current state name from the interrupt."""
-        if hasattr(interrupt, "ns") and interrupt.ns:
+        interrupt_ns = getattr(interrupt, "ns", None)
+        if interrupt_ns:
             # Extract node name from namespace (e.g., "select_topic:uuid" -> "select_topic")
-            node_namespace = interrupt.ns[0] if interrupt.ns else ""
+            node_namespace = interrupt_ns[0]
             if ":" in node_namespace:
                 return node_namespace.split(":")[0]
             else:
@@ -1,3 +1,4 @@
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
 from django.db import models
 from django.utils import timezone
 
@@ -22,11 +23,18 @@ class Store(models.Model):
 
     class Meta:
         db_table = "store"  # Should match the LangGraph's implementation.
+        # Lookups by prefix use the leading column of the unique constraint's B-tree.
         indexes = [
-            models.Index(fields=["prefix"], name="store_prefix_idx"),
-            models.Index(fields=["expires_at"], name="store_expires_at_idx"),
+            # Only items written with a TTL ever expire, so the sweep never needs the NULL rows
+            models.Index(
+                fields=["expires_at"],
+                name="store_expires_at_idx",
+                condition=models.Q(expires_at__isnull=False),
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["prefix", "key"], name="store_prefix_key_uniq"),
         ]
-        unique_together = (("prefix", "key"),)
 
     def __str__(self):
         return f"Store(prefix={self.prefix}, key={self.key})"
@@ -56,10 +64,23 @@ class Checkpoint(models.Model):
 
     class Meta:
         db_table = "checkpoints"  # Should match the LangGraph's implementation.
+        # The unique constraint's B-tree leads with thread_id, so it also serves lookups and
+        # deletes by thread_id alone; a separate thread_id index would only slow down writes.
         indexes = [
-            models.Index(fields=["thread_id"], name="checkpoints_thread_id_idx"),
+            # Checkpoint history filters metadata with @> containment only, which jsonb_path_ops
+            # serves at about half the size of the default jsonb_ops operator class.
+            GinIndex(
+                fields=["metadata"],
+                name="checkpoints_metadata_gin_idx",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["thread_id", "checkpoint_ns", "checkpoint_id"],
+                name="checkpoints_thread_ns_id_uniq",
+            ),
         ]
-        unique_together = (("thread_id", "checkpoint_ns", "checkpoint_id"),)
 
 
 class CheckpointBlob(models.Model):
@@ -93,10 +114,13 @@ class CheckpointBlob(models.Model):
 
     class Meta:
         db_table = "checkpoint_blobs"  # Should match the LangGraph's implementation.
-        indexes = [
-            models.Index(fields=["thread_id"], name="checkpoint_blobs_thread_id_idx"),
+        # Lookups by thread_id use the leading column of the unique constraint's B-tree.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["thread_id", "checkpoint_ns", "channel", "version"],
+                name="checkpoint_blobs_thread_ns_channel_version_uniq",
+            ),
         ]
-        unique_together = (("thread_id", "checkpoint_ns", "channel", "version"),)
 
 
 class CheckpointWrite(models.Model):
@@ -117,10 +141,13 @@ class CheckpointWrite(models.Model):
 
     class Meta:
         db_table = "checkpoint_writes"  # Should match the LangGraph's implementation.
-        indexes = [
-            models.Index(fields=["thread_id"], name="checkpoint_writes_thrd_id_idx"),
+        # Lookups by thread_id use the leading column of the unique constraint's B-tree.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["thread_id", "checkpoint_ns", "checkpoint_id", "task_id", "idx"],
+                name="checkpoint_writes_thread_ns_id_task_idx_uniq",
+            ),
         ]
-        unique_together = (("thread_id", "checkpoint_ns", "checkpoint_id", "task_id", "idx"),)
 
 
 class CacheEntry(models.Model):
@@ -144,11 +171,15 @@ class CacheEntry(models.Model):
 
     class Meta:
         db_table = "graflow_cache_entry"
+        # Lookups and deletes by namespace use the leading column of the unique constraint's B-tree.
         indexes = [
-            models.Index(fields=["namespace"], name="cache_namespace_idx"),
-            models.Index(fields=["expires_at"], name="cache_expires_at_idx"),
+            # Entries are written with expires_at = now + TTL, so expiry follows insertion order
+            # closely and a BRIN index prunes the expiry sweep at a fraction of a B-tree's size.
+            BrinIndex(fields=["expires_at"], name="cache_expires_at_idx", pages_per_range=32),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["namespace", "key"], name="cache_namespace_key_uniq"),
         ]
-        unique_together = (("namespace", "key"),)
 
     def __str__(self):
         return f"CacheEntry(namespace={self.namespace}, key={self.key})"
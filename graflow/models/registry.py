@@ -1,19 +1,85 @@
+import functools
+import importlib
 import logging
-from typing import TYPE_CHECKING
+import operator
+import threading
+import weakref
+from typing import TYPE_CHECKING, cast
 
 from django.db import models
 from langgraph.graph import StateGraph
+from langgraph.graph.state import CompiledStateGraph
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
 logger = logging.getLogger(__name__)
 
+# Compiled graphs keyed by (app_name, flow_type, version, builder_path). A graph is immutable once
+# built and the storage components are process-wide singletons, so it can be shared between flows.
+# At most GRAFLOW_COMPILED_GRAPH_CACHE_SIZE graphs are kept alive, oldest first out; graphs evicted
+# while still in use by a running flow stay reachable through the weak-valued tier.
+_compiled_graphs: dict[tuple[str, str, str, str], CompiledStateGraph] = {}
+_compiled_graphs_weak: (
+    "weakref.WeakValueDictionary[tuple[str, str, str, str], CompiledStateGraph]"
+) = weakref.WeakValueDictionary()
+_compiled_graphs_lock = threading.Lock()
 
+
+def clear_graph_cache():
+    """
+    Drop all compiled graphs, imported paths and state definitions cached by FlowType.
+
+    Mostly useful in tests, or after builder modules have been reloaded.
+    """
+    with _compiled_graphs_lock:
+        _compiled_graphs.clear()
+        _compiled_graphs_weak.clear()
+    _resolve_state_definition.cache_clear()
+    _import_from_string.cache_clear()
+
+
+def _invalidate_compiled_graphs(app_name: str, flow_type: str, version: str):
+    """Drop the compiled graphs cached for one flow type version, whatever its builder path."""
+    with _compiled_graphs_lock:
+        for key in [
+            key for key in _compiled_graphs_weak if key[:3] == (app_name, flow_type, version)
+        ]:
+            _compiled_graphs.pop(key, None)
+            _compiled_graphs_weak.pop(key, None)
+
+
+def _remember_compiled_graph(
+    key: tuple[str, str, str, str], graph: CompiledStateGraph
+) -> CompiledStateGraph:
+    """
+    Store a compiled graph in both cache tiers and evict the oldest strong entries over the limit.
+
+    Must be called with _compiled_graphs_lock held. If another thread cached the same key
+    meanwhile, that graph wins and is returned instead.
+    """
+    from django.conf import settings
+
+    cached = _compiled_graphs_weak.get(key)
+    if cached is not None:
+        graph = cached
+    _compiled_graphs[key] = graph
+    _compiled_graphs_weak[key] = graph
+
+    max_size = getattr(settings, "GRAFLOW_COMPILED_GRAPH_CACHE_SIZE", 128)
+    while len(_compiled_graphs) > max_size:
+        del _compiled_graphs[next(iter(_compiled_graphs))]
+    return graph
+
+
+@functools.cache
 def _import_from_string(path: str):
     """
-    Import a class or function from a string path.
+    Import a class or function from a string path, cached per path.
+
+    Permission and throttle classes are resolved on every request, so repeat lookups are a
+    dict hit. Failures raise and are therefore not cached.
 
     Args:
         path: String in format "module.path:attribute" or "module.path.attribute"
@@ -39,15 +105,30 @@ def _import_from_string(path: str):
         )
 
     try:
-        module = __import__(module_path, fromlist=[attr_name])
-        attr = getattr(module, attr_name)
-        return attr
+        module = importlib.import_module(module_path)
+        return operator.attrgetter(attr_name)(module)
     except ImportError as e:
         raise ValueError(f"Failed to import module '{module_path}': {e}") from e
     except AttributeError as e:
         raise ValueError(f"Module '{module_path}' has no attribute '{attr_name}'") from e
 
 
+@functools.cache
+def _resolve_state_definition(state_path: str) -> type[BaseModel]:
+    """
+    Import and validate a state class path, cached per path.
+
+    Raises:
+        ValueError: If state class cannot be imported or is invalid (failures are not cached)
+    """
+    state_class = _import_from_string(state_path)
+    if not isinstance(state_class, type) or not issubclass(state_class, BaseModel):
+        raise ValueError(
+            f"State path '{state_path}' does not resolve to a Pydantic BaseModel class"
+        )
+    return state_class
+
+
 class FlowTypeQuerySet(models.QuerySet):
     """Custom QuerySet for FlowType with additional filtering methods."""
 
@@ -66,6 +147,26 @@ class FlowTypeQuerySet(models.QuerySet):
             app_name=app_name, flow_type=flow_type, is_latest=True, is_active=True
         ).first()
 
+    def latest_by_key(self, keys) -> "dict[tuple[str, str], FlowType]":
+        """
+        Get the latest active versions of many flow types with a single query.
+
+        Args:
+            keys: Iterable of (app_name, flow_type) pairs
+
+        Returns:
+            Dict mapping (app_name, flow_type) to its latest FlowType (missing keys are absent)
+        """
+        key_filter = models.Q()
+        for app_name, flow_type in set(keys):
+            key_filter |= models.Q(app_name=app_name, flow_type=flow_type)
+        if not key_filter:
+            return {}
+        flow_types = cast(
+            "Iterable[FlowType]", self.filter(key_filter, is_latest=True, is_active=True)
+        )
+        return {(flow_type.app_name, flow_type.flow_type): flow_type for flow_type in flow_types}
+
     def for_app(self, app_name: str):
         """
         Filter flow types by application name.
@@ -199,6 +300,16 @@ class FlowType(models.Model):
     def __str__(self):
         return f"{self.app_name}:{self.flow_type}:{self.version}"
 
+    def save(self, *args, **kwargs):
+        # Re-registering a flow type (e.g. pointing it at another builder) must not keep serving
+        # the graph compiled from the previous definition.
+        super().save(*args, **kwargs)
+        _invalidate_compiled_graphs(self.app_name, self.flow_type, self.version)
+
+    def delete(self, *args, **kwargs):
+        _invalidate_compiled_graphs(self.app_name, self.flow_type, self.version)
+        return super().delete(*args, **kwargs)
+
     def get_builder(self) -> "Callable[[], StateGraph]":
         """
         Get the builder function for this flow type.
@@ -224,19 +335,18 @@ class FlowType(models.Model):
         Raises:
             ValueError: If state class cannot be imported or is invalid
         """
-        state_class = _import_from_string(self.state_path)
-        if not isinstance(state_class, type) or not issubclass(state_class, BaseModel):
-            raise ValueError(
-                f"State path '{self.state_path}' does not resolve to a Pydantic BaseModel class"
-            )
-        return state_class
+        return _resolve_state_definition(self.state_path)
 
-    def get_graph(self) -> StateGraph:
+    def get_graph(self) -> CompiledStateGraph:
         """
         Get the compiled graph for this flow type.
 
         The graph is compiled with storage components (cache, checkpointer, store)
-        and configured with a run name based on the flow type identifiers.
+        and configured with a run name based on the flow type identifiers. Compiled
+        graphs are cached per process, up to GRAFLOW_COMPILED_GRAPH_CACHE_SIZE of them,
+        and dropped when the flow type is saved or deleted, see clear_graph_cache().
+        Builder functions must therefore be pure: they are not called again while the
+        graph stays cached.
 
         Returns:
             Compiled StateGraph ready for execution
@@ -246,11 +356,22 @@ class FlowType(models.Model):
         """
         from graflow.storage import get_storage_components
 
+        key = (self.app_name, self.flow_type, self.version, self.builder_path)
+        cached = _compiled_graphs.get(key)
+        if cached is not None:
+            return cached
+
+        # Evicted from the bounded tier but still alive elsewhere: reuse it instead of rebuilding
+        with _compiled_graphs_lock:
+            cached = _compiled_graphs_weak.get(key)
+            if cached is not None:
+                return _remember_compiled_graph(key, cached)
+
         try:
             builder_func = self.get_builder()
             node_cache, checkpointer, store = get_storage_components()
 
-            graph = (
+            compiled: CompiledStateGraph = (
                 builder_func()
                 .compile(
                     cache=node_cache,
@@ -259,12 +380,15 @@ class FlowType(models.Model):
                 )
                 .with_config({"run_name": f"{self.app_name}_{self.flow_type}_{self.version}"})
             )
-            return graph  # type: ignore[return-value]
         except Exception as e:
             raise ValueError(
                 f"Error building graph {self.app_name}:{self.flow_type}:{self.version}: {e}"
             ) from e
 
+        # Another thread may have built the same graph meanwhile; keep the first one
+        with _compiled_graphs_lock:
+            return _remember_compiled_graph(key, compiled)
+
     def get_permission_instance(self, permission_type: str = "crud"):
         """
         Get a permission instance for this flow type.
@@ -294,8 +418,11 @@ class FlowType(models.Model):
             return permission_class()
         except (ValueError, AttributeError, ImportError) as e:
             logger.warning(
-                f"Failed to load permission class '{permission_path}' for "
-                f"{self.app_name}:{self.flow_type}: {e}. Using default."
+                "Failed to load permission class '%s' for %s:%s: %s. Using default.",
+                permission_path,
+                self.app_name,
+                self.flow_type,
+                e,
             )
             # Fallback to default
             require_auth = getattr(settings, "GRAFLOW_REQUIRE_AUTHENTICATION", True)
@@ -324,8 +451,11 @@ class FlowType(models.Model):
             return throttle_class()
         except (ValueError, AttributeError, ImportError) as e:
             logger.warning(
-                f"Failed to load throttle class '{throttle_path}' for "
-                f"{self.app_name}:{self.flow_type}: {e}. Using default."
+                "Failed to load throttle class '%s' for %s:%s: %s. Using default.",
+                throttle_path,
+                self.app_name,
+                self.flow_type,
+                e,
             )
             # Fallback to None (will use default viewset throttles)
             return None
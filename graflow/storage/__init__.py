@@ -5,6 +5,8 @@ This module provides utilities to get storage components (cache, checkpointer, s
 needed for compiling LangGraph graphs with persistence.
 """
 
+import threading
+
 from django.conf import settings
 from dotenv import load_dotenv
 from langgraph.cache.memory import InMemoryCache
@@ -17,9 +19,12 @@ from graflow.storage.store import DjangoStore
 
 # Lazy initialization of storage components
 # This ensures they're only created when needed, after Django has set up the database
-_node_cache = None
-_checkpointer = None
-_store = None
+_storage_components = None
+_storage_components_lock = threading.Lock()
+
+# Load the .env file once at import rather than on every storage (re-)initialization, since
+# load_dotenv walks the filesystem.
+load_dotenv()
 
 
 def _prepare_storage():
@@ -28,8 +33,6 @@ def _prepare_storage():
 
     This function creates Django-based storage components (cache, checkpointer, store).
     """
-    load_dotenv()
-
     node_cache = DjangoCache()
     checkpointer = DjangoSaver()
     store = DjangoStore()
@@ -59,14 +62,19 @@ def get_storage_components():
         ...     store=store,
         ... )
     """
-    global _node_cache, _checkpointer, _store
-    if _node_cache is None or _checkpointer is None or _store is None:
-        # Use getattr with default to safely access settings
-        persistence_backend = getattr(settings, "GRAFLOW_PERSISTENCE_BACKEND", "django")
-        if persistence_backend == "django":
-            _node_cache, _checkpointer, _store = _prepare_storage()
-        else:
-            _node_cache = InMemoryCache()
-            _checkpointer = MemorySaver()
-            _store = InMemoryStore()
-    return _node_cache, _checkpointer, _store
+    global _storage_components
+    # Fast path: a single read of the module global, no lock once initialized
+    storage_components = _storage_components
+    if storage_components is not None:
+        return storage_components
+
+    with _storage_components_lock:
+        # Another thread may have initialized the components while we waited for the lock
+        if _storage_components is None:
+            # Use getattr with default to safely access settings
+            persistence_backend = getattr(settings, "GRAFLOW_PERSISTENCE_BACKEND", "django")
+            if persistence_backend == "django":
+                _storage_components = _prepare_storage()
+            else:
+                _storage_components = (InMemoryCache(), MemorySaver(), InMemoryStore())
+        return _storage_components
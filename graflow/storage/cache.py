@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import json
 import threading
@@ -180,6 +181,16 @@ def create_cache_key(prefix: str, data: dict[str, Any] | None = None) -> str:
     return f"{prefix}_{hash_hex}"
 
 
+# Values that hash and compare like their JSON form once their type is part of the lookup key
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+@functools.lru_cache(maxsize=128)
+def _create_scalar_cache_key(prefix: str, typed_items: tuple[tuple[str, type, Any], ...]) -> str:
+    """Memoized create_cache_key() for scalar-only data, keyed by (name, type, value) triples."""
+    return create_cache_key(prefix, {name: value for name, _, value in typed_items})
+
+
 def create_cache_key_from_fields(prefix: str, obj: Any, fields: list[str]) -> str:
     """
     Create a cache key by extracting specific fields from an object (Pydantic model or dict).
@@ -212,4 +223,26 @@ def create_cache_key_from_fields(prefix: str, obj: Any, fields: list[str]) -> st
             else:
                 data[field] = None
 
-    return create_cache_key(prefix, data)
+    return create_cache_key_from_values(prefix, tuple(data), tuple(data.values()))
+
+
+def create_cache_key_from_values(prefix: str, fields: Sequence[str], values: Sequence[Any]) -> str:
+    """
+    Create a cache key from field values that have already been extracted.
+
+    Produces the same key as create_cache_key_from_fields() for the same field values.
+
+    Args:
+        prefix: A string prefix for the cache key (e.g., "outline", "content")
+        fields: Field names, in the same order as values
+        values: Field values
+
+    Returns:
+        A cache key string in format: {prefix}_{hash}
+    """
+    # Replays of a node with the same scalar inputs (retries, loops) skip the JSON dump and hash
+    if all(type(value) in _SCALAR_TYPES for value in values):
+        return _create_scalar_cache_key(
+            prefix, tuple(zip(fields, map(type, values), values, strict=True))
+        )
+    return create_cache_key(prefix, dict(zip(fields, values, strict=True)))
@@ -1,6 +1,17 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
 
-from graflow.storage.cache import DjangoCache
+from graflow.models.langgraph import CacheEntry, Store
+from graflow.storage.cache import (
+    DjangoCache,
+    create_cache_key,
+    create_cache_key_from_fields,
+    create_cache_key_from_values,
+)
 
 
 class PostgresCacheTest(TestCase):
@@ -97,3 +108,49 @@ class PostgresCacheTest(TestCase):
         self.assertIn("active_entries", stats)
         self.assertIn("expired_entries", stats)
         self.assertEqual(stats["total_entries"], 2)
+
+
+class CacheKeyTest(TestCase):
+    def test_cache_key_from_fields_matches_create_cache_key(self):
+        state = {"topic": "Python", "level": 2, "tags": ["a", "b"]}
+        # Scalar-only fields go through the memoized path, mixed ones through the plain one
+        for fields in (["topic", "level"], ["topic", "tags"]):
+            expected = create_cache_key("node", {field: state[field] for field in fields})
+            self.assertEqual(create_cache_key_from_fields("node", state, fields), expected)
+            self.assertEqual(create_cache_key_from_fields("node", state, fields), expected)
+
+    def test_cache_key_from_values_matches_cache_key_from_fields(self):
+        state = {"topic": "Python", "tags": ["a", "b"]}
+        self.assertEqual(
+            create_cache_key_from_values("node", ("topic", "tags"), ("Python", ["a", "b"])),
+            create_cache_key_from_fields("node", state, ["topic", "tags"]),
+        )
+
+    def test_cache_key_from_fields_distinguishes_equal_values_of_different_types(self):
+        key_int = create_cache_key_from_fields("node", {"value": 1}, ["value"])
+        key_bool = create_cache_key_from_fields("node", {"value": True}, ["value"])
+        self.assertNotEqual(key_int, key_bool)
+
+
+class PurgeExpiredCommandTest(TestCase):
+    """Test the purge_expired management command."""
+
+    def test_purges_only_expired_rows(self):
+        past = timezone.now() - timedelta(minutes=1)
+        future = timezone.now() + timedelta(minutes=1)
+        for key, expires_at in (("expired", past), ("live", future), ("forever", None)):
+            Store.objects.create(prefix="ns", key=key, value={}, expires_at=expires_at)
+            CacheEntry.objects.create(
+                namespace="[]",
+                key=key,
+                value_encoding="json",
+                value_data=b"{}",
+                expires_at=expires_at,
+            )
+
+        out = StringIO()
+        call_command("purge_expired", stdout=out)
+
+        self.assertIn("Purged 1 expired store item(s) and 1 cache entry(ies)", out.getvalue())
+        self.assertEqual(set(Store.objects.values_list("key", flat=True)), {"live", "forever"})
+        self.assertEqual(set(CacheEntry.objects.values_list("key", flat=True)), {"live", "forever"})
@@ -1,5 +1,8 @@
+from unittest.mock import patch
+
 from django.conf import settings
 from django.test import TestCase
+from langgraph.checkpoint.base import empty_checkpoint
 
 from graflow.storage.checkpointer import DjangoSaver
 
@@ -65,3 +68,41 @@ class DjangoSaverTest(TestCase):
                 cur.execute("SELECT 1")
                 result = cur.fetchone()
                 self.assertEqual(result["?column?"], 1)
+
+    def test_get_latest_tuples(self):
+        """Test the latest checkpoint of several threads is fetched in one query and served
+        from get_tuple() while prefetched."""
+        if self.saver.conn.info.encoding != "utf-8":
+            # Text columns (thread_id) come back as bytes from e.g. SQL_ASCII databases
+            self.skipTest("Test requires a UTF8 database")
+
+        thread_ids = ["prefetch-test-a", "prefetch-test-b"]
+        try:
+            for thread_id, count in zip(thread_ids, (2, 1), strict=True):
+                for _ in range(count):
+                    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+                    self.saver.put(config, empty_checkpoint(), {}, {})
+
+            tuples = self.saver.get_latest_tuples([*thread_ids, "prefetch-test-missing"])
+
+            self.assertIsNone(tuples["prefetch-test-missing"])
+            for thread_id in thread_ids:
+                config = {"configurable": {"thread_id": thread_id}}
+                self.assertEqual(
+                    tuples[thread_id].checkpoint["id"],
+                    self.saver.get_tuple(config).checkpoint["id"],
+                )
+
+            with (
+                self.saver.prefetched_tuples(tuples),
+                patch.object(self.saver, "_cursor", side_effect=AssertionError("unexpected query")),
+            ):
+                saved = self.saver.get_tuple({"configurable": {"thread_id": thread_ids[0]}})
+                missing = self.saver.get_tuple(
+                    {"configurable": {"thread_id": "prefetch-test-missing"}}
+                )
+            self.assertIs(saved, tuples[thread_ids[0]])
+            self.assertIsNone(missing)
+        finally:
+            for thread_id in thread_ids:
+                self.saver.delete_thread(thread_id)
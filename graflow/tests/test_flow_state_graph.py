@@ -9,15 +9,18 @@ Tests cover:
 - Logging functionality
 """
 
+import functools
+import gc
 import logging
+import weakref
 
 from django.test import TestCase
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, START
-from pydantic import Field
+from pydantic import Field, computed_field
 
 from graflow.graphs.base import BaseGraphState
-from graflow.graphs.flow_state_graph import FlowStateGraph
+from graflow.graphs.flow_state_graph import FlowStateGraph, _get_param_names, _param_names_cache
 
 
 class TestState(BaseGraphState):  # noqa: N801
@@ -200,6 +203,26 @@ class FlowStateGraphTest(TestCase):
 
         self.assertIn("Field 'topic' not found", str(ctx.exception))
 
+    def test_add_llm_call_node_property_parameter(self):
+        """Test LLM call node accepts parameters that name a property of the state."""
+
+        class StateWithProperty(TestState):
+            @property
+            def shouted_topic(self) -> str:
+                return self.topic.upper()
+
+        graph = FlowStateGraph(StateWithProperty, "test")
+
+        def generate_result(shouted_topic: str) -> str:
+            return f"Topic: {shouted_topic}"
+
+        graph.add_llm_call_node(generate_result, "result")
+        graph.add_edge(START, "generate_result")
+        graph.add_edge("generate_result", END)
+
+        result = graph.compile().invoke({"topic": "math"}, config=self.config)
+        self.assertEqual(result["result"], "Topic: MATH")
+
     def test_add_llm_call_node_with_default_parameter(self):
         """Test LLM call node works with default parameters."""
         graph = FlowStateGraph(TestState, "test")
@@ -227,6 +250,56 @@ class FlowStateGraphTest(TestCase):
         result2 = graph.compile().invoke({"topic": ""}, config=self.config)
         self.assertEqual(result2["result"], "Topic: ")
 
+    def test_add_llm_call_node_with_partial(self):
+        """Test LLM call node resolves parameters of callables without a code object."""
+        graph = FlowStateGraph(TestState, "test")
+
+        def prefixed_llm(prefix: str, topic: str) -> str:
+            return f"{prefix}{topic}"
+
+        llm = functools.partial(prefixed_llm, "Topic: ")
+        llm.__name__ = "prefixed_llm"  # type: ignore[attr-defined]
+
+        graph.add_llm_call_node(llm, "result")
+        graph.add_edge(START, "prefixed_llm")
+        graph.add_edge("prefixed_llm", END)
+
+        result = graph.compile().invoke({"topic": "Math"}, config=self.config)
+        self.assertEqual(result["result"], "Topic: Math")
+
+    def test_add_llm_call_node_with_unhashable_callable(self):
+        """Test LLM call node accepts callables that cannot be cached by identity."""
+        graph = FlowStateGraph(TestState, "test")
+
+        class TopicLLM:
+            __name__ = "topic_llm"
+
+            def __eq__(self, other):  # Defining __eq__ makes instances unhashable
+                return isinstance(other, TopicLLM)
+
+            def __call__(self, topic: str) -> str:
+                return f"Topic: {topic}"
+
+        graph.add_llm_call_node(TopicLLM(), "result")
+        graph.add_edge(START, "topic_llm")
+        graph.add_edge("topic_llm", END)
+
+        result = graph.compile().invoke({"topic": "Math"}, config=self.config)
+        self.assertEqual(result["result"], "Topic: Math")
+
+    def test_param_names_cache_does_not_keep_functions_alive(self):
+        """Test the parameter name cache holds functions weakly."""
+
+        def generate_result(topic: str) -> str:
+            return topic
+
+        self.assertEqual(_get_param_names(generate_result), ("topic",))
+        self.assertIn(generate_result, _param_names_cache)
+        function_ref = weakref.ref(generate_result)
+        del generate_result
+        gc.collect()
+        self.assertIsNone(function_ref())
+
     def test_add_llm_call_node_cache_policy(self):
         """Test that LLM call nodes have cache policy."""
         graph = FlowStateGraph(TestState, "test")
@@ -282,6 +355,48 @@ class FlowStateGraphTest(TestCase):
         self.assertEqual(interrupt_data["counter"], 42)
         self.assertIn("required_data", interrupt_data)
 
+    def test_add_send_data_node_multiple_fields(self):
+        """Test send data node interrupts with all updated fields."""
+        graph = FlowStateGraph(TestState, "test")
+        graph.add_send_data_node(updated_fields=["topic", "counter"])
+        graph.add_edge(START, "send_topic_and_counter")
+
+        result = graph.compile().invoke({"topic": "Math", "counter": 3}, config=self.config)
+
+        interrupt_data = result["__interrupt__"][0].value
+        self.assertEqual(interrupt_data, {"topic": "Math", "counter": 3})
+
+    def test_add_data_receiver_node_unknown_field(self):
+        """Test data receiver rejects fields that are not part of the state."""
+        graph = FlowStateGraph(TestState, "test")
+
+        with self.assertRaises(ValueError) as ctx:
+            graph.add_data_receiver_node(required_fields=["value"], updated_fields=["missing"])
+
+        self.assertIn("Field 'missing' not found", str(ctx.exception))
+
+    def test_add_send_data_node_derived_fields(self):
+        """Test send data node accepts computed fields and properties of the state."""
+
+        class StateWithDerivedFields(TestState):
+            @computed_field  # type: ignore[prop-decorator]
+            @property
+            def topic_length(self) -> int:
+                return len(self.topic)
+
+            @property
+            def shouted_topic(self) -> str:
+                return self.topic.upper()
+
+        graph = FlowStateGraph(StateWithDerivedFields, "test")
+        graph.add_send_data_node(updated_fields=["topic_length", "shouted_topic"])
+        graph.add_edge(START, "send_topic_length_and_shouted_topic")
+
+        result = graph.compile().invoke({"topic": "math"}, config=self.config)
+
+        interrupt_data = result["__interrupt__"][0].value
+        self.assertEqual(interrupt_data, {"topic_length": 4, "shouted_topic": "MATH"})
+
     def test_add_data_receiver_node_with_custom_name(self):
         """Test data receiver with custom node name."""
         graph = FlowStateGraph(TestState, "test")
@@ -1,6 +1,10 @@
 """Comprehensive test suite for Flows API."""
 
+from unittest.mock import PropertyMock, patch
+
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -169,6 +173,36 @@ class FlowsAPITest(APITestCase):
         # Verify it's in interrupted state, not completed
         self.assertEqual(response.data["status"], "interrupted", "Flow should be waiting for input")
 
+    def test_create_completed_flow_reuses_result_state(self):
+        """A completed create should return the final state without re-reading the checkpoint."""
+        url = reverse("graflow:flow-list")
+        data = {"flow_type": "test_graph", "state": {"counter": 5, "branch_choice": "right"}}
+        with patch.object(Flow, "state", new_callable=PropertyMock) as state_mock:
+            response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["status"], "completed")
+        state_mock.assert_not_called()
+
+        # The returned state matches what the detail endpoint reads from the checkpoint
+        detail_url = reverse("graflow:flow-detail", kwargs={"pk": response.data["id"]})
+        detail_response = self.client.get(detail_url)
+        self.assertEqual(response.data["state"], detail_response.data["state"])
+
+    def test_create_flow_looks_up_latest_flow_type_once(self):
+        """Permissions, throttles and create should share one latest FlowType lookup."""
+        url = reverse("graflow:flow-list")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(url, {"flow_type": "test_graph"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        latest_lookups = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if "graflow_flow_type" in q["sql"] and '"graflow_flow_type"."is_latest")' in q["sql"]
+        ]
+        self.assertEqual(len(latest_lookups), 1)
+
     def test_list_flows(self):
         """Test listing user's flows."""
         # Create and initialize flows
@@ -573,6 +607,20 @@ class FlowsAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
 
+    def test_query_numbers_match_by_value(self):
+        """Test a float-looking state filter matches an int state value."""
+        flow = FlowFactory.create(user=self.user1)
+        flow.resume({"user_id": self.user1.id, "flow_id": flow.id})
+        flow.resume(
+            {"user_id": self.user1.id, "flow_id": flow.id, "counter": 42, "should_pause": True}
+        )
+
+        url = reverse("graflow:flow-list") + "?flow_type=test_flow&state__counter=43.0"
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+
     def test_query_no_matches(self):
         """Test query with no matching flows."""
         url = reverse("graflow:flow-list") + "?flow_type=test_flow&state__counter=999"
@@ -1026,6 +1074,30 @@ class FlowsAPITest(APITestCase):
         # Verify the interrupted flow we created is in the stats
         self.assertGreaterEqual(response.data["by_status"]["interrupted"], 1)
 
+    def test_stats_query_count_independent_of_flow_types(self):
+        """Stats should aggregate in two grouped queries regardless of how many types exist."""
+        admin_user = User.objects.create_user(
+            email="admin@test.com",
+            username="admin",
+            password="testpass123",
+            is_staff=True,
+        )
+        self.client.force_authenticate(user=admin_user)
+        FlowFactory.create(user=admin_user, flow_type="test_flow")
+        FlowFactory.create(user=admin_user, flow_type="minimal_test_flow")
+        FlowFactory.create(user=admin_user, flow_type="test_graph")
+
+        url = reverse("graflow:flow-stats")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["by_type"], {"test_flow": 1, "minimal_test_flow": 1, "test_graph": 1}
+        )
+        flow_queries = [q for q in ctx.captured_queries if '"graflow_flow"' in q["sql"]]
+        self.assertEqual(len(flow_queries), 2)
+
     def test_stats_respects_user_isolation(self):
         """Test that stats only include user's own flows."""
         # Stats endpoint requires admin user
@@ -1293,6 +1365,14 @@ class FlowTypesAPITest(APITestCase):
             ],
         )
 
+    def test_list_flow_types_is_sorted(self):
+        url = reverse("graflow:flow-type-list")
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        keys = [(item["app_name"], item["flow_type"], item["version"]) for item in response.data]
+        self.assertEqual(keys, sorted(keys))
+
     def test_requires_authentication(self):
         from django.conf import settings
 
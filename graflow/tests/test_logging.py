@@ -1,7 +1,9 @@
 import logging
+from typing import Literal
 
 from django.test import TestCase
 from langgraph.graph import START
+from langgraph.types import Command
 
 from graflow.graphs.base import BaseGraphState
 from graflow.graphs.flow_state_graph import FlowStateGraph
@@ -104,3 +106,31 @@ class LoggingTests(TestCase):
 
         output = "\n".join(log.output)
         self.assertIn("[ENTER] send_value", output)
+
+    def test_node_logs_only_errors_when_info_disabled(self):
+
+        def useless_node(state):
+            raise ValueError("something bad happened")
+
+        self.flow.add_node(useless_node, "useless_node")
+        self.flow.add_edge(START, "useless_node")
+
+        with self.assertLogs(logger, level="WARNING") as log:
+            with self.assertRaises(ValueError):
+                self.flow.compile().invoke({})
+
+        output = "\n".join(log.output)
+
+        self.assertNotIn("[ENTER] useless_node", output)
+        self.assertIn("[ERROR] useless_node", output)
+        self.assertIn("something bad happened", output)
+
+    def test_logged_node_keeps_command_destinations(self):
+
+        def router(state) -> Command[Literal["target"]]:
+            return Command(goto="target")
+
+        self.flow.add_node(router, "router")
+
+        # LangGraph reads the return annotation through the logging wrapper
+        self.assertEqual(self.flow.nodes["router"].ends, ("target",))
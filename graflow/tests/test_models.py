@@ -1,11 +1,17 @@
 """Unit tests for Flow model and FlowQuerySet."""
 
+from datetime import UTC, datetime
+from decimal import Decimal
 from types import SimpleNamespace
+from unittest.mock import PropertyMock, patch
 
 from django.contrib.auth import get_user_model
+from django.core import checks
 from django.test import TestCase
+from django.utils import timezone
+from pydantic import BaseModel
 
-from graflow.models.flows import Flow
+from graflow.models.flows import Flow, FlowQuerySet
 from graflow.models.registry import FlowType
 from graflow.tests.factories import FlowFactory
 
@@ -81,6 +87,15 @@ class FlowModelTest(TestCase):
         flow.refresh_from_db()
         self.assertEqual(flow.status, Flow.STATUS_CANCELLED)
 
+    def test_cancel_writes_only_status(self):
+        """Test cancel does not overwrite columns changed elsewhere since the flow was loaded."""
+        flow = FlowFactory.create(user=self.user1, status=Flow.STATUS_PENDING)
+        Flow.objects.filter(pk=flow.pk).update(display_name="Renamed")
+        flow.cancel()
+        flow.refresh_from_db()
+        self.assertEqual(flow.status, Flow.STATUS_CANCELLED)
+        self.assertEqual(flow.display_name, "Renamed")
+
     def test_cancel_on_completed_raises_error(self):
         """Test cancel raises ValueError on terminal state."""
         flow = FlowFactory.create(user=self.user1, status=Flow.STATUS_COMPLETED)
@@ -195,6 +210,65 @@ class FlowModelTest(TestCase):
         self.assertIsInstance(state, dict)
         self.assertNotIn("current_state_name", state)
 
+    def test_convert_pydantic_models_returns_plain_state_unchanged(self):
+        """States without Pydantic models should be returned without copying."""
+        flow = FlowFactory.build()
+        state = {"counter": 1, "nested": {"items": [1, 2]}}
+        self.assertIs(flow._convert_pydantic_models(state), state)
+
+    def test_convert_pydantic_models_converts_nested_models(self):
+        """Nested Pydantic models should be dumped without mutating the original state."""
+
+        class Item(BaseModel):
+            name: str
+
+        flow = FlowFactory.build()
+        state = {"items": (Item(name="a"), {"inner": [Item(name="b")]}), "counter": 1}
+        converted = flow._convert_pydantic_models(state)
+        self.assertEqual(
+            converted, {"items": [{"name": "a"}, {"inner": [{"name": "b"}]}], "counter": 1}
+        )
+        self.assertIsInstance(state["items"][0], Item)
+
+    def test_prefetch_states_shares_flow_type_lookup(self):
+        """prefetch_states should resolve the FlowTypes of all flows with one query."""
+        FlowFactory.create_batch(3, user=self.user1, flow_type="test_flow", app_name="test_app")
+        with self.assertNumQueries(2):
+            flows = Flow.objects.filter(user=self.user1).prefetch_states()
+            definitions = {flow.graph_state_definition for flow in flows}
+        self.assertEqual(len(definitions), 1)
+        self.assertEqual(len({id(flow.flow_type_obj) for flow in flows}), 1)
+
+    def test_state_and_current_state_name_share_snapshot(self):
+        """state and get_current_state_name should read the checkpointer once per instance."""
+        flow = FlowFactory.create(user=self.user1)
+        flow.resume({"user_id": self.user1.id, "flow_id": flow.id})
+        flow = Flow.objects.get(pk=flow.pk)
+        with patch.object(flow.graph, "get_state", wraps=flow.graph.get_state) as get_state:
+            _ = flow.state
+            _ = flow.state
+            _ = flow.get_current_state_name()
+        self.assertEqual(get_state.call_count, 1)
+
+    def test_resume_stores_current_state_name(self):
+        """resume() should persist the interrupt node so reading it needs no snapshot."""
+        flow = FlowFactory.create(user=self.user1)
+        flow.resume({"user_id": self.user1.id, "flow_id": flow.id})
+        flow.resume({"user_id": self.user1.id, "flow_id": flow.id, "should_pause": True})
+
+        flow = Flow.objects.get(pk=flow.pk)
+        self.assertEqual(flow.status, Flow.STATUS_INTERRUPTED)
+        with patch.object(flow.graph, "get_state") as get_state:
+            self.assertEqual(flow.get_current_state_name(), "checkpoint")
+        get_state.assert_not_called()
+
+    def test_resume_drops_cached_snapshot(self):
+        """A snapshot read before resume() must not be served afterwards."""
+        flow = FlowFactory.create(user=self.user1)
+        self.assertIsNone(flow.state)
+        flow.resume({"user_id": self.user1.id, "flow_id": flow.id, "counter": 42})
+        self.assertEqual(flow.state["counter"], 43)
+
     def test_graph_state_definition_missing_flow_type(self):
         """Accessing graph_state_definition should raise a clear error if FlowType is missing."""
         flow = FlowFactory.create(
@@ -207,6 +281,13 @@ class FlowModelTest(TestCase):
             _ = flow.graph_state_definition
         self.assertIn("FlowType not found", str(context.exception))
 
+    def test_graph_and_state_definition_share_flow_type_lookup(self):
+        """graph and graph_state_definition should resolve the FlowType with a single query."""
+        flow = FlowFactory.create(user=self.user1, flow_type="test_flow", app_name="test_app")
+        with self.assertNumQueries(1):
+            _ = flow.graph
+            _ = flow.graph_state_definition
+
 
 class FlowQuerySetTest(TestCase):
     """Unit tests for FlowQuerySet methods."""
@@ -273,6 +354,29 @@ class FlowQuerySetTest(TestCase):
                 flow.status, [Flow.STATUS_PENDING, Flow.STATUS_RUNNING, Flow.STATUS_INTERRUPTED]
             )
 
+    def test_cancel_if_active(self):
+        """Test cancel_if_active cancels only in-progress flows and returns the row count."""
+        cancelled = Flow.objects.for_user(self.user1).cancel_if_active()
+        self.assertEqual(cancelled, 2)
+        statuses = set(Flow.objects.for_user(self.user1).values_list("status", flat=True))
+        self.assertEqual(statuses, {Flow.STATUS_CANCELLED, Flow.STATUS_COMPLETED})
+        # Other users' flows are untouched
+        self.assertEqual(Flow.objects.for_user(self.user2).in_progress().count(), 1)
+
+    def test_mark_running(self):
+        """Test mark_running moves only resumable flows to running in one UPDATE."""
+        before = timezone.now()
+        with self.assertNumQueries(1):
+            marked = Flow.objects.for_user(self.user1).mark_running()
+        self.assertEqual(marked, 2)
+        running = Flow.objects.for_user(self.user1).filter(status=Flow.STATUS_RUNNING)
+        self.assertEqual(running.count(), 2)
+        self.assertTrue(all(flow.last_resumed_at >= before for flow in running))
+        # Completed flows are not resumable
+        self.assertEqual(
+            Flow.objects.for_user(self.user1).filter(status=Flow.STATUS_COMPLETED).count(), 1
+        )
+
     def test_by_recency_ordering(self):
         """Test by_recency orders by last_resumed_at descending."""
         flows = list(Flow.objects.by_recency())
@@ -364,6 +468,171 @@ class FlowQuerySetTest(TestCase):
         filtered = all_flows.filter_by_state(counter="43")
         self.assertEqual(len(filtered), 1)
 
+    def test_filter_by_state_uses_snapshot(self):
+        """Test filter_by_state matches resumed flows on latest_state without reading state."""
+        flow = FlowFactory.create(user=self.user1)
+        flow.resume({"user_id": self.user1.id, "flow_id": flow.id, "counter": 42})
+        flow.refresh_from_db()
+        self.assertEqual(flow.latest_state["counter"], 43)
+        self.assertNotIn("user_id", flow.latest_state)
+
+        # Only flows without a snapshot fall back to the checkpointer
+        flows = Flow.objects.filter(user=self.user1).exclude(latest_state__isnull=True)
+        with self.assertNumQueries(1):
+            filtered = flows.filter_by_state(counter="43", nested_data__branch="left")
+        self.assertEqual([f.id for f in filtered], [flow.id])
+
+    def test_str_does_not_query_user_per_flow(self):
+        """Test the default manager joins the user so __str__ on a listing is one query."""
+        with self.assertNumQueries(1):
+            names = [str(flow) for flow in Flow.objects.filter(user=self.user1)]
+        self.assertTrue(all(self.user1.username in name for name in names))
+
+    def test_lightweight_defers_heavy_fields(self):
+        """Test lightweight defers error_message and latest_state, also under filter_by_state."""
+        flow = FlowFactory.create(user=self.user1)
+        flow.resume({"user_id": self.user1.id, "flow_id": flow.id, "counter": 42})
+
+        flows = Flow.objects.filter(pk=flow.pk).lightweight()
+        self.assertEqual(flows.get().get_deferred_fields(), {"error_message", "latest_state"})
+        with self.assertNumQueries(1):
+            filtered = flows.filter_by_state(counter=43)
+        self.assertEqual([f.id for f in filtered], [flow.id])
+
+    def test_filter_by_state_falls_back_without_snapshot(self):
+        """Test filter_by_state reads the checkpointer for flows resumed before snapshots."""
+        flow = FlowFactory.create(user=self.user1)
+        flow.resume({"user_id": self.user1.id, "flow_id": flow.id, "counter": 42})
+        Flow.objects.filter(pk=flow.pk).update(latest_state=None)
+
+        filtered = Flow.objects.filter(user=self.user1).filter_by_state(counter=43)
+        self.assertEqual([f.id for f in filtered], [flow.id])
+
+    def test_matches_state_filters_compares_same_types_directly(self):
+        """Test same-type values compare with == and mixed types fall back to strings."""
+        state = {"data": {"count": 3, "tags": {"a": 1, "b": 2}}, "flag": True}
+        matches = FlowQuerySet._matches_state_filters
+        self.assertTrue(matches(state, [(["data", "count"], "3")]))
+        self.assertTrue(matches(state, [(["data", "tags"], {"b": 2, "a": 1})]))
+        self.assertTrue(matches(state, [(["flag"], "True")]))
+        self.assertFalse(matches(state, [(["flag"], 1)]))
+        self.assertFalse(matches(state, [(["data", "missing"], "3")]))
+
+    def test_matches_state_filters_compares_numbers_by_value(self):
+        """Test ints and floats compare by value, like jsonb containment does."""
+        matches = FlowQuerySet._matches_state_filters
+        self.assertTrue(matches({"score": 1.0}, [(["score"], 1)]))
+        self.assertTrue(matches({"score": 1.0}, [(["score"], "1")]))
+        self.assertTrue(matches({"score": 1}, [(["score"], "1.0")]))
+        self.assertFalse(matches({"score": 1.5}, [(["score"], "1")]))
+        self.assertFalse(matches({"score": 1}, [(["score"], True)]))
+
+    def test_filter_by_state_numbers_agree_with_and_without_snapshot(self):
+        """Test int/float filters give the same result from latest_state and the fallback."""
+        flow = FlowFactory.create(
+            user=self.user1, status=Flow.STATUS_INTERRUPTED, latest_state={"score": 1.0}
+        )
+        flows = Flow.objects.filter(pk=flow.pk)
+        expected = [(1, True), ("1", True), (1.0, True), ("1.0", True), (2, False), ("1.5", False)]
+
+        for value, should_match in expected:
+            with self.subTest(value=value, path="snapshot"):
+                self.assertEqual(bool(flows.filter_by_state(score=value)), should_match)
+
+        flows.update(latest_state=None)
+        with patch.object(Flow, "state", new_callable=PropertyMock, return_value={"score": 1.0}):
+            for value, should_match in expected:
+                with self.subTest(value=value, path="fallback"):
+                    self.assertEqual(bool(flows.filter_by_state(score=value)), should_match)
+
+    def test_filter_by_state_datetimes_and_lists_agree_with_and_without_snapshot(self):
+        """Test datetime and list filters match alike from latest_state and the fallback."""
+        due = datetime(2024, 5, 1, 9, 30, tzinfo=UTC)
+        flow = FlowFactory.create(
+            user=self.user1,
+            status=Flow.STATUS_INTERRUPTED,
+            latest_state={"due": due, "tags": ["math", "easy"]},
+        )
+        flows = Flow.objects.filter(pk=flow.pk)
+        expected = [
+            ({"due": due}, True),
+            ({"due": "2024-05-01T09:30:00Z"}, True),
+            ({"due": datetime(2024, 5, 2, tzinfo=UTC)}, False),
+            ({"tags": ["math"]}, True),
+            ({"tags": ["easy", "math"]}, True),
+            ({"tags": ["hard"]}, False),
+        ]
+
+        for filters, should_match in expected:
+            with self.subTest(filters=filters, path="snapshot"):
+                self.assertEqual(bool(flows.filter_by_state(**filters)), should_match)
+
+        flows.update(latest_state=None)
+        live_state = {"due": due, "tags": ("math", "easy")}
+        with patch.object(Flow, "state", new_callable=PropertyMock, return_value=live_state):
+            for filters, should_match in expected:
+                with self.subTest(filters=filters, path="fallback"):
+                    self.assertEqual(bool(flows.filter_by_state(**filters)), should_match)
+
+    def test_filter_by_state_query_string_rules(self):
+        """Test the matching rules documented for state__* query parameters on both paths."""
+        due = datetime(2024, 5, 1, 9, 30, tzinfo=UTC)
+        live_state = {
+            "counter": 5,
+            "flag": True,
+            "price": Decimal("1.50"),
+            "due": due,
+            "tags": ["math", "easy"],
+            "note": None,
+        }
+        flow = FlowFactory.create(
+            user=self.user1, status=Flow.STATUS_INTERRUPTED, latest_state=live_state
+        )
+        flows = Flow.objects.filter(pk=flow.pk)
+        expected = [
+            ({"counter": "5"}, True),
+            ({"counter": "5.0"}, True),
+            ({"flag": "True"}, True),
+            ({"flag": "true"}, False),
+            ({"price": "1.50"}, True),
+            ({"price": "1.5"}, False),
+            ({"due": "2024-05-01T09:30:00Z"}, True),
+            ({"due": str(due)}, False),
+            ({"tags": str(["math", "easy"])}, False),
+            ({"note": "None"}, False),
+            ({"missing": "5"}, False),
+        ]
+
+        for filters, should_match in expected:
+            with self.subTest(filters=filters, path="snapshot"):
+                self.assertEqual(bool(flows.filter_by_state(**filters)), should_match)
+
+        flows.update(latest_state=None)
+        with patch.object(Flow, "state", new_callable=PropertyMock, return_value=live_state):
+            for filters, should_match in expected:
+                with self.subTest(filters=filters, path="fallback"):
+                    self.assertEqual(bool(flows.filter_by_state(**filters)), should_match)
+
+    def test_filter_by_state_ignores_fields_without_json_form(self):
+        """Test sets and bytes next to the filtered field don't hide the flow on either path."""
+        live_state = {"counter": 5, "tags": {"a"}, "payload": b"raw"}
+        flow = FlowFactory.create(
+            user=self.user1,
+            status=Flow.STATUS_INTERRUPTED,
+            latest_state=Flow._state_snapshot(live_state),
+        )
+        self.assertEqual(flow.latest_state, {"counter": 5})
+        flows = Flow.objects.filter(pk=flow.pk)
+
+        with self.subTest(path="snapshot"):
+            self.assertEqual([f.id for f in flows.filter_by_state(counter="5")], [flow.id])
+
+        flows.update(latest_state=None)
+        with patch.object(Flow, "state", new_callable=PropertyMock, return_value=live_state):
+            with self.subTest(path="fallback"):
+                self.assertEqual([f.id for f in flows.filter_by_state(counter="5")], [flow.id])
+        self.assertTrue(FlowQuerySet._matches_state_filters(live_state, [(["counter"], "5")]))
+
     def test_filter_by_state_empty_filters(self):
         """Test filter_by_state returns all flows when no filters provided."""
         all_flows = list(Flow.objects.filter(user=self.user1))
@@ -381,3 +650,12 @@ class FlowQuerySetTest(TestCase):
             self.assertIn(
                 flow.status, [Flow.STATUS_PENDING, Flow.STATUS_RUNNING, Flow.STATUS_INTERRUPTED]
             )
+
+
+class FlowModelChecksTest(TestCase):
+    """System checks for the PostgreSQL-specific indexes on graflow models."""
+
+    def test_postgres_indexes_pass_system_checks(self):
+        """Test that the GIN/BRIN indexes do not raise postgres.E005."""
+        errors = [error for error in checks.run_checks() if error.id == "postgres.E005"]
+        self.assertEqual(errors, [])
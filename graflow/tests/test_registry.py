@@ -4,10 +4,10 @@ from unittest.mock import patch
 
 from django.conf import settings
 from django.db import IntegrityError
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from rest_framework.permissions import AllowAny, IsAuthenticated
 
-from graflow.models.registry import FlowType, _import_from_string
+from graflow.models.registry import FlowType, _import_from_string, clear_graph_cache
 
 
 class ImportFromStringTest(TestCase):
@@ -35,6 +35,23 @@ class ImportFromStringTest(TestCase):
         result = _import_from_string("graflow.tests.fixtures.test_graph:TestGraphState")
         self.assertEqual(result, TestGraphState)
 
+    def test_import_nested_attribute(self):
+        """Test importing a nested attribute with colon format."""
+        from rest_framework.permissions import IsAuthenticated
+
+        result = _import_from_string("rest_framework.permissions:IsAuthenticated.has_permission")
+        self.assertEqual(result, IsAuthenticated.has_permission)
+
+    def test_import_is_cached(self):
+        """Test repeated imports of the same path resolve the module only once."""
+        clear_graph_cache()
+        with patch("graflow.models.registry.importlib.import_module") as import_mock:
+            first = _import_from_string("some.module:Thing")
+            second = _import_from_string("some.module:Thing")
+        self.assertIs(first, second)
+        import_mock.assert_called_once_with("some.module")
+        clear_graph_cache()
+
     def test_invalid_path_format(self):
         """Test that invalid path format raises ValueError."""
         with self.assertRaises(ValueError) as cm:
@@ -143,6 +160,24 @@ class FlowTypeQuerySetTest(TestCase):
         self.assertEqual(result_app1, self.flow_type_app1_v1)
         self.assertEqual(result_app1.app_name, "app1")
 
+    def test_latest_by_key_fetches_all_keys_in_one_query(self):
+        """Test latest_by_key returns the latest active version of each key with one query."""
+        keys = [("app1", "test_flow"), ("app2", "test_flow"), ("app1", "nonexistent")]
+        with self.assertNumQueries(1):
+            result = FlowType.objects.latest_by_key(keys)
+        self.assertEqual(
+            result,
+            {
+                ("app1", "test_flow"): self.flow_type_app1_v1,
+                ("app2", "test_flow"): self.flow_type_app2_v1,
+            },
+        )
+
+    def test_latest_by_key_without_keys(self):
+        """Test latest_by_key does not query when there are no keys."""
+        with self.assertNumQueries(0):
+            self.assertEqual(FlowType.objects.latest_by_key([]), {})
+
     def test_for_app_filters_by_app_name(self):
         """Test for_app filters flow types by app_name."""
         app1_flows = FlowType.objects.for_app("app1")
@@ -290,6 +325,19 @@ class FlowTypeModelTest(TestCase):
             self.flow_type.get_state_definition()
         self.assertIn("does not resolve to a Pydantic BaseModel class", str(cm.exception))
 
+    def test_get_state_definition_is_cached(self):
+        """Test get_state_definition imports each state path only once."""
+        from graflow.tests.fixtures.test_graph import TestGraphState
+
+        clear_graph_cache()
+        with patch(
+            "graflow.models.registry._import_from_string", return_value=TestGraphState
+        ) as import_mock:
+            self.flow_type.get_state_definition()
+            self.flow_type.get_state_definition()
+        import_mock.assert_called_once_with(self.flow_type.state_path)
+        clear_graph_cache()
+
     def test_get_graph_compiles_successfully(self):
         """Test get_graph compiles graph with storage components."""
         graph = self.flow_type.get_graph()
@@ -303,6 +351,61 @@ class FlowTypeModelTest(TestCase):
         # The run_name is set via with_config, but we can verify the graph was compiled
         self.assertIsNotNone(graph)
 
+    def test_get_graph_is_cached(self):
+        """Test get_graph reuses the compiled graph until the cache is cleared."""
+        clear_graph_cache()
+        graph = self.flow_type.get_graph()
+        self.assertIs(self.flow_type.get_graph(), graph)
+
+        # A different builder path for the same version is compiled separately
+        self.flow_type.builder_path = "graflow.tests.fixtures.test_graph:build_minimal_test_graph"
+        self.assertIsNot(self.flow_type.get_graph(), graph)
+
+        clear_graph_cache()
+        self.flow_type.builder_path = "graflow.tests.fixtures.test_graph:build_test_graph"
+        self.assertIsNot(self.flow_type.get_graph(), graph)
+
+    def test_get_graph_cache_is_bounded(self):
+        """Test the compiled graph cache keeps at most the configured number of graphs alive."""
+        from graflow.models import registry
+
+        other = FlowType.objects.create(
+            app_name=self.flow_type.app_name,
+            flow_type=self.flow_type.flow_type,
+            version="v2",
+            builder_path=self.flow_type.builder_path,
+            state_path=self.flow_type.state_path,
+        )
+        clear_graph_cache()
+        with override_settings(GRAFLOW_COMPILED_GRAPH_CACHE_SIZE=1):
+            graph = self.flow_type.get_graph()
+            other.get_graph()
+            self.assertEqual(len(registry._compiled_graphs), 1)
+            # Still referenced here, so the evicted graph is reused rather than rebuilt
+            self.assertIs(self.flow_type.get_graph(), graph)
+        clear_graph_cache()
+
+    def test_get_graph_cache_is_invalidated_on_save(self):
+        """Test saving or deleting a flow type drops its compiled graph."""
+        clear_graph_cache()
+        graph = self.flow_type.get_graph()
+
+        self.flow_type.description = "Re-registered"
+        self.flow_type.save()
+        rebuilt = self.flow_type.get_graph()
+        self.assertIsNot(rebuilt, graph)
+
+        other = FlowType.objects.create(
+            app_name=self.flow_type.app_name,
+            flow_type=self.flow_type.flow_type,
+            version="v2",
+            builder_path=self.flow_type.builder_path,
+            state_path=self.flow_type.state_path,
+        )
+        other.get_graph()
+        other.delete()
+        self.assertIs(self.flow_type.get_graph(), rebuilt)
+
     def test_get_graph_handles_compilation_errors(self):
         """Test get_graph handles graph compilation errors gracefully."""
         self.flow_type.builder_path = "rest_framework.permissions:IsAuthenticated"